@@ -3,8 +3,11 @@ Configuration module for blockchain simulation
 Contains all blockchain configurations, constants, and default parameters
 """
 
-from dataclasses import dataclass
-from typing import Dict, Any
+import sys
+from dataclasses import dataclass, fields
+from enum import IntEnum
+from types import MappingProxyType
+from typing import Dict, Any, Mapping
 
 # Global simulation constants
 HEADER_SIZE = 1024  # bytes
@@ -12,17 +15,23 @@ TRANSACTION_SIZE = 256  # bytes per transaction
 DIFFICULTY_ADJUSTMENT_BLOCKS = 2016
 MAX_HALVINGS = 35
 MIN_REWARD_THRESHOLD = 0.00000001
+SECONDS_PER_YEAR = 365 * 24 * 60 * 60
+
+
+def _freeze(configs):
+    """Wrap a table of per-key config dicts in read-only mapping views"""
+    return MappingProxyType({key: MappingProxyType(value) for key, value in configs.items()})
+
 
 # Blockchain configurations for different cryptocurrencies
-BLOCKCHAIN_CONFIGS = {
+BLOCKCHAIN_CONFIGS = _freeze({
     'BTC': {
         'name': 'Bitcoin',
         'reward': 50,
         'halving': 210000,
         'block_time': 600,  # 10 minutes
         'max_tx_per_block': 4000,
-        'block_size_limit': 1 * 1024 * 1024,  # 1 MB
-        'description': 'Original Bitcoin with 10-minute block time'
+        'block_size_limit': 1 * 1024 * 1024  # 1 MB
     },
     'BCH': {
         'name': 'Bitcoin Cash',
@@ -30,8 +39,7 @@ BLOCKCHAIN_CONFIGS = {
         'halving': 210000,
         'block_time': 600,  # 10 minutes
         'max_tx_per_block': 128000,
-        'block_size_limit': 32 * 1024 * 1024,  # 32 MB
-        'description': 'Bitcoin Cash with larger blocks'
+        'block_size_limit': 32 * 1024 * 1024  # 32 MB
     },
     'LTC': {
         'name': 'Litecoin',
@@ -39,8 +47,7 @@ BLOCKCHAIN_CONFIGS = {
         'halving': 840000,
         'block_time': 150,  # 2.5 minutes
         'max_tx_per_block': 4000,
-        'block_size_limit': 1 * 1024 * 1024,  # 1 MB
-        'description': 'Litecoin with faster block time'
+        'block_size_limit': 1 * 1024 * 1024  # 1 MB
     },
     'DOGE': {
         'name': 'Dogecoin',
@@ -48,8 +55,7 @@ BLOCKCHAIN_CONFIGS = {
         'halving': None,  # Static reward
         'block_time': 60,  # 1 minute
         'max_tx_per_block': 4000,
-        'block_size_limit': 1 * 1024 * 1024,  # 1 MB
-        'description': 'Dogecoin with static reward'
+        'block_size_limit': 1 * 1024 * 1024  # 1 MB
     },
     'MEMO': {
         'name': 'MEMO',
@@ -57,38 +63,87 @@ BLOCKCHAIN_CONFIGS = {
         'halving': 9644000,
         'block_time': 3.27,  # Very fast blocks
         'max_tx_per_block': 32000,
-        'block_size_limit': 8 * 1024 * 1024,  # 8 MB
-        'description': 'MEMO with very fast block time'
+        'block_size_limit': 8 * 1024 * 1024  # 8 MB
     }
-}
+})
+
+
+
+class ChainId(IntEnum):
+    """Index of each blockchain in the per-field tables below"""
+    BTC = 0
+    BCH = 1
+    LTC = 2
+    DOGE = 3
+    MEMO = 4
+
+
+# Per-field views of BLOCKCHAIN_CONFIGS, indexed by ChainId
+CHAIN_REWARDS = tuple(BLOCKCHAIN_CONFIGS[chain.name]['reward'] for chain in ChainId)
+CHAIN_HALVINGS = tuple(BLOCKCHAIN_CONFIGS[chain.name]['halving'] for chain in ChainId)
+CHAIN_BLOCK_TIMES = tuple(BLOCKCHAIN_CONFIGS[chain.name]['block_time'] for chain in ChainId)
+CHAIN_MAX_TX = tuple(BLOCKCHAIN_CONFIGS[chain.name]['max_tx_per_block'] for chain in ChainId)
+
+# Human-readable chain descriptions and display labels, kept apart from the numeric configs above
+BLOCKCHAIN_DESCRIPTIONS = _freeze({
+    'BTC': {
+        'description': 'Original Bitcoin with 10-minute block time',
+        'block_size': '1 MB base'  # base size, unlike the hard limits of the forks
+    },
+    'BCH': {'description': 'Bitcoin Cash with larger blocks', 'block_size': '32 MB'},
+    'LTC': {'description': 'Litecoin with faster block time', 'block_size': '1 MB'},
+    'DOGE': {'description': 'Dogecoin with static reward', 'block_size': '1 MB'},
+    'MEMO': {'description': 'MEMO with very fast block time', 'block_size': '8 MB'}
+})
+
 
 # Workload configurations
-WORKLOAD_CONFIGS = {
+WORKLOAD_CONFIGS = _freeze({
     'NONE': {
         'wallets': 0,
         'transactions': 0,
-        'interval': 1.0,
-        'description': 'No user transactions, mining only'
+        'interval': 1.0
     },
     'SMALL': {
         'wallets': 10,
         'transactions': 10,
-        'interval': 10.0,
-        'description': 'Small workload: 10 wallets, 10 transactions each, 10s interval'
+        'interval': 10.0
     },
     'MEDIUM': {
         'wallets': 1000,
         'transactions': 1000,
-        'interval': 1.0,
-        'description': 'Medium workload: 1000 wallets, 1000 transactions each, 1s interval'
+        'interval': 1.0
     },
     'LARGE': {
         'wallets': 1000,
         'transactions': 1000,
-        'interval': 0.01,
-        'description': 'Large workload: 1000 wallets, 1000 transactions each, 0.01s interval'
+        'interval': 0.01
     }
-}
+})
+
+# Human-readable workload descriptions, kept apart from the workload parameters above
+WORKLOAD_DESCRIPTIONS = _freeze({
+    'NONE': {'description': 'No user transactions, mining only'},
+    'SMALL': {'description': 'Small workload: 10 wallets, 10 transactions each, 10s interval'},
+    'MEDIUM': {'description': 'Medium workload: 1000 wallets, 1000 transactions each, 1s interval'},
+    'LARGE': {'description': 'Large workload: 1000 wallets, 1000 transactions each, 0.01s interval'}
+})
+
+# Returned for names without a description entry
+_NO_DESCRIPTION = MappingProxyType({})
+
+
+def describe(chain) -> Mapping[str, str]:
+    """Get the description entry of a blockchain by name or ChainId (empty if unknown)"""
+    if isinstance(chain, ChainId):
+        chain = chain.name
+    return BLOCKCHAIN_DESCRIPTIONS.get(chain, _NO_DESCRIPTION)
+
+
+def describe_workload(workload: str) -> Mapping[str, str]:
+    """Get the description entry of a workload by name (empty if unknown)"""
+    return WORKLOAD_DESCRIPTIONS.get(workload, _NO_DESCRIPTION)
+
 
 # Default simulation parameters
 DEFAULT_CONFIG = {
@@ -105,6 +160,7 @@ DEFAULT_CONFIG = {
     'interval': 1.0,
     'blocksize': 4000,
     'blocks': None,
+    'years': 1.0,
     'print': 144,
     'debug': False
 }
@@ -136,7 +192,8 @@ NETWORK_CONFIG = {
 MINING_CONFIG = {
     'hashrate_variance': 0.1,  # 10% variance in hashrate
     'difficulty_adjustment_factor': 0.25,  # How much to adjust difficulty
-    'max_difficulty_change': 4.0  # Maximum 4x difficulty change
+    'max_difficulty_change': 4.0,  # Maximum 4x difficulty change
+    'asert_half_life_blocks': 288  # Blocks of schedule drift that halve/double difficulty (ASERT)
 }
 
 # Transaction parameters
@@ -149,9 +206,16 @@ TRANSACTION_CONFIG = {
 }
 
 
-@dataclass
+@dataclass(frozen=True)
 class SimulationConfig:
-    """Configuration class for simulation parameters"""
+    """Configuration class for simulation parameters (immutable once created)"""
+    __slots__ = (
+        'nodes', 'neighbors', 'miners', 'hashrate', 'blocktime', 'difficulty',
+        'reward', 'halving', 'wallets', 'transactions', 'interval', 'blocksize',
+        'blocks', 'years', 'print_interval', 'debug',
+        '_dict_cache'  # to_dict() result, filled on first call
+    )
+    
     nodes: int
     neighbors: int
     miners: int
@@ -171,51 +235,61 @@ class SimulationConfig:
     
     @classmethod
     def from_args(cls, args):
-        """Create configuration from command line arguments"""
+        """
+        Create configuration from command line arguments
+        
+        Expects every option defined by the simulator's argument parser.
+        Options left unset (None) take their DEFAULT_CONFIG value.
+        """
         # Calculate blocks from years if specified
         blocks = args.blocks
-        years = getattr(args, 'years', 1.0)
-        if hasattr(args, 'years') and args.years and not args.blocks:
-            seconds_per_year = 365 * 24 * 60 * 60
-            blocks_per_year = seconds_per_year / args.blocktime
-            blocks = int(blocks_per_year * args.years)
+        years = DEFAULT_CONFIG['years'] if args.years is None else args.years
+        if years and not blocks:
+            blocks_per_year = SECONDS_PER_YEAR / args.blocktime
+            blocks = int(blocks_per_year * years)
         
-        return cls(
-            nodes=args.nodes,
-            neighbors=args.neighbors,
-            miners=args.miners,
-            hashrate=args.hashrate,
-            blocktime=args.blocktime,
-            difficulty=args.difficulty or (args.blocktime * args.miners * args.hashrate),
-            reward=args.reward,
-            halving=args.halving,
-            wallets=args.wallets,
-            transactions=args.transactions,
-            interval=args.interval,
-            blocksize=args.blocksize,
-            blocks=blocks,
-            years=years,
-            print_interval=args.print,
-            debug=args.debug
-        )
+        # Fill the slots directly instead of going through the generated __init__
+        # (the class is frozen, so fields are set through object.__setattr__)
+        config = cls.__new__(cls)
+        set_field = object.__setattr__
+        set_field(config, 'nodes', args.nodes)
+        set_field(config, 'neighbors', args.neighbors)
+        set_field(config, 'miners', args.miners)
+        set_field(config, 'hashrate', args.hashrate)
+        set_field(config, 'blocktime', args.blocktime)
+        set_field(config, 'difficulty', args.difficulty or (args.blocktime * args.miners * args.hashrate))
+        set_field(config, 'reward', args.reward)
+        set_field(config, 'halving', args.halving)
+        set_field(config, 'wallets', DEFAULT_CONFIG['wallets'] if args.wallets is None else args.wallets)
+        set_field(config, 'transactions',
+                  DEFAULT_CONFIG['transactions'] if args.transactions is None else args.transactions)
+        set_field(config, 'interval', DEFAULT_CONFIG['interval'] if args.interval is None else args.interval)
+        set_field(config, 'blocksize', args.blocksize)
+        set_field(config, 'blocks', blocks)
+        set_field(config, 'years', years)
+        set_field(config, 'print_interval', args.print)
+        set_field(config, 'debug', args.debug)
+        return config
     
     def to_dict(self) -> Dict[str, Any]:
         """Convert configuration to dictionary"""
-        return {
-            'nodes': self.nodes,
-            'neighbors': self.neighbors,
-            'miners': self.miners,
-            'hashrate': self.hashrate,
-            'blocktime': self.blocktime,
-            'difficulty': self.difficulty,
-            'reward': self.reward,
-            'halving': self.halving,
-            'wallets': self.wallets,
-            'transactions': self.transactions,
-            'interval': self.interval,
-            'blocksize': self.blocksize,
-            'blocks': self.blocks,
-            'years': self.years,
-            'print_interval': self.print_interval,
-            'debug': self.debug
-        } 
\ No newline at end of file
+        # Fields never change after construction, so the dict is built once
+        try:
+            values = self._dict_cache
+        except AttributeError:
+            values = {name: getattr(self, name) for name in self._FIELDS}
+            object.__setattr__(self, '_dict_cache', values)
+        return dict(values)
+    
+    def __getstate__(self):
+        """Support pickling/copying of the frozen slotted class"""
+        return tuple(getattr(self, name) for name in self._FIELDS)
+    
+    def __setstate__(self, state):
+        """Restore fields saved by __getstate__"""
+        for name, value in zip(self._FIELDS, state):
+            object.__setattr__(self, name, value)
+
+
+# Field names in declaration order, interned once so to_dict() reuses the same key objects
+SimulationConfig._FIELDS = tuple(sys.intern(f.name) for f in fields(SimulationConfig))
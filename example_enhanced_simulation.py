@@ -11,9 +11,8 @@ This script shows:
 
 import time
 import json
-from simulator import BlockchainSimulator
+import argparse
 from config import SimulationConfig, BLOCKCHAIN_CONFIGS, WORKLOAD_CONFIGS
-from trace_loader import TraceLoader
 
 def demonstrate_enhanced_network_simulation():
     """Demonstrate enhanced network simulation features"""
@@ -21,6 +20,9 @@ def demonstrate_enhanced_network_simulation():
     print("ENHANCED NETWORK SIMULATION DEMONSTRATION")
     print("=" * 60)
     
+    from simulator import BlockchainSimulator, configure_logging
+    configure_logging()
+    
     # Create configuration for Bitcoin with medium workload
     config = SimulationConfig(
         nodes=15,  # More nodes for better network simulation
@@ -67,6 +69,8 @@ def demonstrate_trace_loading():
     print("TRACE LOADING DEMONSTRATION")
     print("=" * 60)
     
+    from trace_loader import TraceLoader
+    
     # Create trace loader
     trace_loader = TraceLoader()
     
@@ -119,10 +123,12 @@ def demonstrate_dynamic_fees():
     print("Fee calculation for 1.0 coin transaction:")
     print("-" * 50)
     
-    for priority in test_priorities:
-        # Test different network congestion levels
-        for congestion in [0.0, 0.25, 0.5, 0.75, 1.0]:
-            fee = fee_calc.calculate_fee(test_amount, priority, congestion)
+    # Test different network congestion levels for every priority in one call
+    test_congestions = [0.0, 0.25, 0.5, 0.75, 1.0]
+    fees = fee_calc.calculate_fee_batch(test_amount, test_priorities, test_congestions)
+    
+    for priority, priority_fees in zip(test_priorities, fees):
+        for congestion, fee in zip(test_congestions, priority_fees):
             print(f"Priority: {priority:8} | Congestion: {congestion*100:3.0f}% | Fee: {fee:.6f}")
         print()
     
@@ -138,6 +144,9 @@ def demonstrate_network_conditions():
     print("NETWORK CONDITION MONITORING DEMONSTRATION")
     print("=" * 60)
     
+    from simulator import BlockchainSimulator, configure_logging
+    configure_logging()
+    
     # Create a simple simulation to show network conditions
     config = SimulationConfig(
         nodes=10,
@@ -182,35 +191,43 @@ def demonstrate_network_conditions():
     print(f"  Average propagation time: {network_stats['network_stats']['average_propagation_time']:.3f}s")
     print(f"  Total network data: {network_stats['network_stats']['total_network_data'] / (1024*1024):.1f} MB")
 
+# Demonstrations selectable from the command line, in the order "all" runs them
+DEMOS = {
+    'network': demonstrate_enhanced_network_simulation,
+    'traces': demonstrate_trace_loading,
+    'fees': demonstrate_dynamic_fees,
+    'conditions': demonstrate_network_conditions
+}
+
 def main():
     """Main demonstration function"""
+    parser = argparse.ArgumentParser(description='Blockchain simulation enhanced features demonstration')
+    parser.add_argument('demo', nargs='?', choices=list(DEMOS) + ['all'], default='all',
+                       help='Demonstration to run (default: all)')
+    args = parser.parse_args()
+    
+    selected = list(DEMOS.values()) if args.demo == 'all' else [DEMOS[args.demo]]
+    
     print("BLOCKCHAIN SIMULATION ENHANCED FEATURES DEMONSTRATION")
     print("=" * 80)
     
     try:
-        # Demonstrate enhanced network simulation
-        network_stats = demonstrate_enhanced_network_simulation()
-        
-        # Demonstrate trace loading
-        trace_loader = demonstrate_trace_loading()
-        
-        # Demonstrate dynamic fees
-        demonstrate_dynamic_fees()
-        
-        # Demonstrate network condition monitoring
-        demonstrate_network_conditions()
+        for demo in selected:
+            demo()
         
         print("\n" + "=" * 80)
         print("DEMONSTRATION COMPLETE")
         print("=" * 80)
-        print("\nEnhanced features demonstrated:")
-        print("✓ Network latency simulation with processing delays")
-        print("✓ Bandwidth simulation based on block size")
-        print("✓ Dynamic fee calculation based on network conditions")
-        print("✓ Enhanced wallet balance tracking")
-        print("✓ Network congestion monitoring")
-        print("✓ Trace loading from various sources")
-        print("✓ Real-time network condition updates")
+        
+        if args.demo == 'all':
+            print("\nEnhanced features demonstrated:")
+            print("✓ Network latency simulation with processing delays")
+            print("✓ Bandwidth simulation based on block size")
+            print("✓ Dynamic fee calculation based on network conditions")
+            print("✓ Enhanced wallet balance tracking")
+            print("✓ Network congestion monitoring")
+            print("✓ Trace loading from various sources")
+            print("✓ Real-time network condition updates")
         
     except Exception as e:
         print(f"Error during demonstration: {e}")
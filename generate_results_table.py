@@ -1,60 +1,227 @@
+import io
 import os
+import re
+import sys
 import json
+from operator import itemgetter
+from concurrent.futures import ThreadPoolExecutor
 
-# Blockchain config for static info
-BLOCKCHAIN_CONFIGS = {
-    'btc':  { 'name': 'Bitcoin (BTC)',        'reward': '50 BTC',         'halving': '210K blocks',  'block_time': '600 sec',  'block_size': '1 MB base', 'max_tx': '4K TX' },
-    'bch':  { 'name': 'Bitcoin Cash (BCH)',   'reward': '12.5 BCH',       'halving': '210K blocks',  'block_time': '600 sec',  'block_size': '32 MB',     'max_tx': '128K TX' },
-    'ltc':  { 'name': 'Litecoin (LTC)',       'reward': '50 LTC',         'halving': '840K blocks',  'block_time': '150 sec',  'block_size': '1 MB',      'max_tx': '4K TX' },
-    'doge': { 'name': 'Dogecoin (DOGE)',      'reward': '10 000 DOGE (static)', 'halving': 'None',     'block_time': '60 sec',   'block_size': '1 MB',      'max_tx': '4K TX' },
-    'memo': { 'name': 'MEMO',                 'reward': '51.8457072 MEMO','halving': '9644K blocks', 'block_time': '3.27 sec', 'block_size': '8 MB',      'max_tx': '32K TX' },
-}
+# Optional fast JSON parser
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
 
-# Find all result JSON files
+# Optional streaming JSON parser, preferred for large result files
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
+from config import BLOCKCHAIN_CONFIGS as CHAIN_CONFIGS, describe
+
+
+def describe_chain(symbol, config):
+    """Format a chain's static parameters for display"""
+    halving = config['halving']
+    block_size = describe(symbol).get('block_size') or f"{config['block_size_limit'] // (1024 * 1024)} MB"
+    reward = f"{config['reward']:,} {symbol}".replace(',', ' ')
+    return {
+        'name': f"{config['name']} ({symbol})" if config['name'] != symbol else symbol,
+        'reward': reward if halving else f"{reward} (static)",
+        'halving': f"{halving // 1000}K blocks" if halving else 'None',
+        'block_time': f"{config['block_time']:g} sec",
+        'block_size': block_size,
+        'max_tx': f"{config['max_tx_per_block'] // 1000}K TX"
+    }
+
+
+# Display strings for static chain info, built once from the canonical configs
+BLOCKCHAIN_CONFIGS = {symbol.lower(): describe_chain(symbol, config) for symbol, config in CHAIN_CONFIGS.items()}
+
+# Matches any chain key inside a result filename
+CHAIN_PATTERN = re.compile('(' + '|'.join(map(re.escape, BLOCKCHAIN_CONFIGS)) + ')', re.IGNORECASE)
+UNKNOWN_INFO = {k: '?' for k in BLOCKCHAIN_CONFIGS['btc']}
+
+# Static columns, in table order
+INFO_COLUMNS = itemgetter('name', 'reward', 'halving', 'block_time', 'block_size', 'max_tx')
+
+# Shared fallback for missing nested sections (never mutated)
+EMPTY = {}
+
+# Paths, relative to a result object, of the sections and scalars extract_stats reads
+STREAMED_SECTIONS = frozenset({'stats', 'stats.simulation_stats', 'simulation_stats'})
+STREAMED_FIELDS = frozenset({
+    'simulation_time', 'total_coins', 'blocks_mined',
+    'stats.simulation_time', 'stats.total_coins', 'stats.blocks_mined',
+    'stats.simulation_stats.total_coins', 'stats.simulation_stats.total_blocks',
+    'simulation_stats.total_coins', 'simulation_stats.total_blocks'
+})
+SCALAR_EVENTS = frozenset({'number', 'string', 'boolean', 'null'})
+
+# Find all result JSON files (hidden files such as the stats cache are skipped)
 results_dir = 'results'
-files = [f for f in os.listdir(results_dir) if f.endswith('.json')]
+files = sorted(f for f in os.listdir(results_dir) if f.endswith('.json') and not f.startswith('.'))
 
-# Prepare table header
-header = [
-    'Chain', 'Block Reward', 'Halving Schedule', 'Block Time', 'Block Size Limit', 'Max TX per Block',
-    'Coins Created', 'Blocks Mined', 'Sim Time (s)'
-]
-rows = []
+# Extracted stats are cached per file and reused while the file's mtime and size
+# are unchanged. The cache is plain JSON data, since results directories get
+# shared and copied around and must never be able to run code when read.
+cache_path = os.path.join(results_dir, '.table_cache.json')
 
-for fname in sorted(files):
-    path = os.path.join(results_dir, fname)
-    with open(path) as f:
-        data = json.load(f)
+
+def valid_entry(entry):
+    """Check a cache entry has the shape [[mtime_ns, size], [coins, blocks, sim_time]]"""
+    if not (isinstance(entry, list) and len(entry) == 2):
+        return False
+    key, stats = entry
+    return (isinstance(key, list) and len(key) == 2 and all(type(v) is int for v in key)
+            and isinstance(stats, list) and len(stats) == 3
+            and all(isinstance(v, (int, float, str)) and not isinstance(v, bool) for v in stats))
+
+
+def load_cache():
+    """Load the extracted-stats cache, dropping entries that are missing or malformed"""
+    try:
+        with open(cache_path, 'rb') as f:
+            raw = f.read()
+        data = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+    except (OSError, ValueError):
+        return {}
+    if not isinstance(data, dict):
+        return {}
+    return {fname: entry for fname, entry in data.items() if valid_entry(entry)}
+
+
+def save_cache(cache):
+    """Persist the extracted-stats cache"""
+    try:
+        if ORJSON_AVAILABLE:
+            with open(cache_path, 'wb') as f:
+                f.write(orjson.dumps(cache))
+        else:
+            with open(cache_path, 'w') as f:
+                json.dump(cache, f)
+    except OSError:
+        pass
+
+
+def section(data, dotted):
+    """Get (creating as needed) the nested dict at a dotted path"""
+    if dotted:
+        for name in dotted.split('.'):
+            data = data.setdefault(name, {})
+    return data
+
+
+def stream_result(path):
+    """
+    Stream-parse a result file, keeping only the fields extract_stats reads
     
+    Returns a sparse copy of the result object with the same shape, so the
+    rest of the object graph (blocks, wallets, per-node stats) is never built.
+    """
+    sparse = {}
+    with open(path, 'rb') as f:
+        events = ijson.parse(f, use_float=True)
+        _, root_event, _ = next(events)
+        is_list = root_event == 'start_array'
+
+        for prefix, event, value in events:
+            if is_list:
+                # Only the first result in a list is used
+                if prefix == 'item' and event == 'end_map':
+                    break
+                prefix = prefix[5:]
+
+            if event == 'start_map' and prefix in STREAMED_SECTIONS:
+                section(sparse, prefix)
+            elif event in SCALAR_EVENTS and prefix in STREAMED_FIELDS:
+                parent, _, name = prefix.rpartition('.')
+                section(sparse, parent)[name] = value
+    return sparse
+
+
+def load_result(path):
+    """Parse a result JSON file"""
+    if IJSON_AVAILABLE:
+        return stream_result(path)
+    with open(path, 'rb') as f:
+        raw = f.read()
+    return orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+
+
+def extract_stats(data):
+    """Pull coins created, blocks mined and simulation time out of a result"""
     # Handle the case where data is a list containing a dictionary
     if isinstance(data, list) and len(data) > 0:
         data = data[0]
-    
-    # Try to get chain key from filename
-    for key in BLOCKCHAIN_CONFIGS:
-        if key in fname.lower():
-            info = BLOCKCHAIN_CONFIGS[key]
-            break
-    else:
-        info = {k: '?' for k in BLOCKCHAIN_CONFIGS['btc']}
-    
-    # Extract stats
+
     stats = data.get('stats', data)
-    coins = stats.get('total_coins') or stats.get('simulation_stats',{}).get('total_coins') or '?'
-    blocks = stats.get('blocks_mined') or stats.get('simulation_stats',{}).get('total_blocks') or '?'
+    sim_stats = stats.get('simulation_stats', EMPTY)
+    coins = stats.get('total_coins') or sim_stats.get('total_coins') or '?'
+    blocks = stats.get('blocks_mined') or sim_stats.get('total_blocks') or '?'
     sim_time = data.get('simulation_time') or stats.get('simulation_time') or '?'
-    
-    # Format
-    row = [
-        info['name'], info['reward'], info['halving'], info['block_time'], info['block_size'], info['max_tx'],
-        f"{coins:.2f}" if isinstance(coins, (int,float)) else coins,
-        f"{blocks}" if blocks != '?' else '?',
-        f"{sim_time:.2f}" if isinstance(sim_time, (int,float)) else sim_time
-    ]
-    rows.append(row)
-
-# Print markdown table
-print('| ' + ' | '.join(header) + ' |')
-print('|' + '|'.join(['-'*len(h) for h in header]) + '|')
+    return coins, blocks, sim_time
+
+
+def format_number(value):
+    """Format a numeric stat with two decimals, passing placeholders through"""
+    return f"{value:.2f}" if isinstance(value, (int, float)) else value
+
+
+def read_stats(fname):
+    """Return the cache entry for a result file, parsing it only if the file changed"""
+    path = os.path.join(results_dir, fname)
+    st = os.stat(path)
+    key = [st.st_mtime_ns, st.st_size]
+
+    cached = cache.get(fname)
+    if cached and cached[0] == key:
+        return cached, False
+    return [key, list(extract_stats(load_result(path)))], True
+
+
+# Prepare table header
+header = [
+    'Chain', 'Block Reward', 'Halving Schedule', 'Block Time', 'Block Size Limit', 'Max TX per Block',
+    'Coins Created', 'Blocks Mined', 'Sim Time (s)'
+]
+ROW_TEMPLATE = '| ' + ' | '.join(['%s'] * len(header)) + ' |\n'
+cache = load_cache()
+cache_dirty = False
+
+# Read files concurrently; map() keeps results in filename order
+with ThreadPoolExecutor(max_workers=8) as executor:
+    loaded = list(executor.map(read_stats, files))
+
+info_columns = []
+stat_records = []
+for fname, (entry, changed) in zip(files, loaded):
+    if changed:
+        cache[fname] = entry
+        cache_dirty = True
+    stat_records.append(entry[1])
+
+    # Try to get chain key from filename
+    match = CHAIN_PATTERN.search(fname)
+    info = BLOCKCHAIN_CONFIGS[match.group(1).lower()] if match else UNKNOWN_INFO
+    info_columns.append(INFO_COLUMNS(info))
+
+# Format the stat columns one column at a time, then stitch rows together
+coins_col, blocks_col, time_col = zip(*stat_records) if stat_records else ((), (), ())
+stat_columns = zip(map(format_number, coins_col), map(str, blocks_col), map(format_number, time_col))
+rows = [info + stats for info, stats in zip(info_columns, stat_columns)]
+
+if cache_dirty:
+    save_cache(cache)
+
+# Print markdown table, buffered and written in one go
+out = io.StringIO()
+out.write(ROW_TEMPLATE % tuple(header))
+out.write('|' + '|'.join(['-'*len(h) for h in header]) + '|\n')
 for row in rows:
-    print('| ' + ' | '.join(row) + ' |') 
\ No newline at end of file
+    out.write(ROW_TEMPLATE % row)
+sys.stdout.write(out.getvalue())
+
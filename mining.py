@@ -4,21 +4,60 @@ Handles mining operations, difficulty adjustment, and mining statistics
 """
 
 import random
+import sys
 import time
 import threading
 import logging
-import statistics
 from typing import List, Dict, Optional
-from dataclasses import dataclass
 import math
+import heapq
+from itertools import accumulate, count
+from operator import attrgetter
 
 from models import Block, Transaction, MiningStats
-from config import DIFFICULTY_ADJUSTMENT_BLOCKS, MINING_CONFIG, HEADER_SIZE, TRANSACTION_SIZE
+from config import MINING_CONFIG, HEADER_SIZE, TRANSACTION_SIZE
 
 logger = logging.getLogger(__name__)
 
+# Dedicated generator for all mining draws, independent of the global random state
+_rng = random.Random()
+
+# Pre-drawn unit-mean exponential variates for block inter-arrival times,
+# consumed from the end and refilled in batches
+_INTERVAL_BATCH = 4096
+_unit_intervals: List[float] = []
+
+# Transaction ID accessor for map() when listing a block's transactions
+_get_tx_id = attrgetter('tx_id')
+
+
+def reseed(seed=None):
+    """Reseed the mining generator and drop variates drawn from the old state"""
+    _rng.seed(seed)
+    del _unit_intervals[:]
+
+
+def _compute_new_difficulty(anchor_difficulty: float, time_delta: float, height_delta: int,
+                            target: float, half_life: float,
+                            min_difficulty: float, max_difficulty: float) -> float:
+    """
+    ASERT difficulty: the anchor difficulty scaled by 2^(-schedule drift / half-life)
+    
+    Args:
+        anchor_difficulty: Difficulty at the anchor block
+        time_delta: Block time accumulated since the anchor
+        height_delta: Blocks mined since the anchor
+        target: Target block time
+        half_life: Half-life in blocks; being this many block times behind schedule halves difficulty
+        min_difficulty: Lower bound for the result
+        max_difficulty: Upper bound for the result
+    """
+    # Positive when blocks came slower than scheduled, which lowers difficulty
+    drift = (time_delta - target * height_delta) / (target * half_life)
+    drift = max(-64.0, min(64.0, drift))  # Beyond the clamps anyway; keeps 2 ** x finite
+    return max(min_difficulty, min(max_difficulty, anchor_difficulty * 2.0 ** -drift))
+
 
-@dataclass
 class Miner:
     """
     Represents a mining node in the blockchain network
@@ -26,41 +65,57 @@ class Miner:
     Attributes:
         miner_id: Unique identifier for the miner
         hashrate: Mining hashrate (hashes per second)
+        actual_hashrate: Hashrate after per-miner variance is applied
         blocks_mined: Number of blocks successfully mined
         total_mining_time: float = 0.0
-        running: Whether the miner is currently running
+        running: Whether the miner is currently running (read from the stop event)
     """
-    miner_id: str
-    hashrate: float
-    blocks_mined: int = 0
-    total_mining_time: float = 0.0
-    running: bool = False
+    __slots__ = ('miner_id', 'hashrate', 'actual_hashrate', 'blocks_mined', 'total_mining_time', '_stop_event')
     
-    def __post_init__(self):
-        """Initialize miner with variance in hashrate"""
+    def __init__(self, miner_id: str, hashrate: float, blocks_mined: int = 0,
+                 total_mining_time: float = 0.0, stop_event: Optional[threading.Event] = None):
+        self.miner_id = sys.intern(miner_id)  # Used as a dict key across mining, stats and wallets
+        self.hashrate = hashrate
+        self.blocks_mined = blocks_mined
+        self.total_mining_time = total_mining_time
+        # Shared with the other miners of a MiningManager; set while mining is stopped
+        if stop_event is None:
+            stop_event = threading.Event()
+            stop_event.set()
+        self._stop_event = stop_event
+        
         # Add some variance to hashrate to simulate real-world conditions
-        variance = random.uniform(
+        variance = _rng.uniform(
             1 - MINING_CONFIG['hashrate_variance'],
             1 + MINING_CONFIG['hashrate_variance']
         )
         self.actual_hashrate = self.hashrate * variance
         logger.info(f"Created miner {self.miner_id} with hashrate {self.actual_hashrate:.2f} H/s")
         
+    @property
+    def running(self) -> bool:
+        """Whether the miner is currently running"""
+        return not self._stop_event.is_set()
+        
+    def detach(self):
+        """Stop the miner for good, independently of the miners it shared a stop event with"""
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        
     def mine_block(self, mining_manager) -> Optional[Block]:
         """Mine a single block with realistic difficulty simulation"""
         try:
-            # Calculate expected mining time based on difficulty and hashrate
-            expected_mining_time = self._calculate_expected_mining_time(mining_manager)
+            # The block arrives now, at its scheduled simulation time; it has been
+            # mined since the previous block
+            mining_started = mining_manager.get_last_block_time()
+            mining_time = mining_manager.get_simulation_time() - mining_started
             
-            # Get current simulation time (not real time)
-            current_sim_time = mining_manager.get_simulation_time()
-            
-            block = self._create_block(mining_manager, current_sim_time, expected_mining_time)
+            block = self._create_block(mining_manager, mining_started, mining_time)
             if block:
                 success = mining_manager.submit_block(block, self.miner_id)
                 if success:
                     self.blocks_mined += 1
-                    logger.info(f"Miner {self.miner_id} successfully submitted block {block.block_id} (total: {self.blocks_mined})")
+                    logger.debug("Miner %s successfully submitted block %s (total: %d)", self.miner_id, block.block_id, self.blocks_mined)
                     return block
                 else:
                     logger.warning(f"Miner {self.miner_id} failed to submit block {block.block_id}")
@@ -72,33 +127,7 @@ class Miner:
             
         return None
                 
-    def _calculate_expected_mining_time(self, mining_manager) -> float:
-        """Calculate expected time to mine next block based on target block time"""
-        # Use the configured block time as the target
-        target_block_time = mining_manager.config.blocktime
-        
-        # For realistic simulation, use the actual target block time
-        # This matches the professor's expected output format
-        if len(mining_manager.blocks) == 0:
-            # First block takes the full target time
-            base_time = target_block_time
-        else:
-            # Subsequent blocks should be close to target time
-            # Add some variance to simulate real mining
-            base_time = target_block_time
-        
-        # Add variance to simulate real mining (80% to 120% of target)
-        variance = random.uniform(0.8, 1.2)
-        expected_time = base_time * variance
-        
-        # Ensure reasonable bounds
-        expected_time = max(1.0, min(expected_time, target_block_time * 2))
-        
-        # Don't scale up the time - use realistic values
-        # The professor's output shows reasonable block times like 591.31s
-        return expected_time
-            
-    def _create_block(self, mining_manager, current_sim_time, mining_time) -> Optional[Block]:
+    def _create_block(self, mining_manager, mining_started, mining_time) -> Optional[Block]:
         """Create a new block"""
         try:
             # Get transactions from the transaction pool
@@ -115,12 +144,12 @@ class Miner:
             # Get next block ID in a thread-safe way
             block_id = mining_manager.get_next_block_id()
             
-            transaction_ids = [tx.tx_id for tx in transactions]
+            transaction_ids = list(map(_get_tx_id, transactions))
             
             # Store the actual transaction objects in the block for processing
             block = Block(
                 block_id=block_id,
-                timestamp=current_sim_time + mining_time,  # Set timestamp to when block was actually mined
+                timestamp=mining_started + mining_time,  # Set timestamp to when block was actually mined
                 time_since_last=time_since_last,
                 transaction_count=len(transactions),
                 size=block_size,
@@ -128,12 +157,10 @@ class Miner:
                 miner_reward=mining_manager.get_block_reward(),
                 previous_hash=mining_manager.get_last_block_hash(),
                 miner_id=self.miner_id,
-                difficulty=mining_manager.get_current_difficulty()
+                difficulty=mining_manager.get_current_difficulty(),
+                transaction_objects=transactions
             )
             
-            # Store the actual transaction objects for processing
-            block.transaction_objects = transactions
-            
             return block
             
         except Exception as e:
@@ -144,7 +171,7 @@ class Miner:
         """Update miner statistics"""
         self.blocks_mined += 1
         self.total_mining_time += mining_time
-        logger.info(f"Miner {self.miner_id} mined block #{self.blocks_mined} in {mining_time:.2f}s")
+        logger.debug("Miner %s mined block #%d in %.2fs", self.miner_id, self.blocks_mined, mining_time)
         
     def get_efficiency(self) -> float:
         """Get mining efficiency (blocks per hour)"""
@@ -154,13 +181,16 @@ class Miner:
         
     def to_dict(self) -> Dict:
         """Convert miner to dictionary"""
+        # Efficiency computed inline (same as get_efficiency) from the values already loaded
+        blocks_mined = self.blocks_mined
+        total_mining_time = self.total_mining_time
         return {
             'miner_id': self.miner_id,
             'hashrate': self.hashrate,
             'actual_hashrate': self.actual_hashrate,
-            'blocks_mined': self.blocks_mined,
-            'total_mining_time': self.total_mining_time,
-            'efficiency': self.get_efficiency(),
+            'blocks_mined': blocks_mined,
+            'total_mining_time': total_mining_time,
+            'efficiency': (blocks_mined * 3600) / total_mining_time if total_mining_time > 0 else 0.0,
             'running': self.running
         }
 
@@ -179,17 +209,48 @@ class MiningManager:
     def __init__(self, config, mining_stats: MiningStats):
         self.config = config
         self.mining_stats = mining_stats
-        self.miners: List[Miner] = []
+        self.miners: Dict[str, Miner] = {}  # miner_id -> Miner, in join order
         self.blocks: List[Block] = []
+        self._block_ids = set()  # IDs of blocks in self.blocks, for duplicate checks
+        self._total_hashrate = 0.0  # Sum of actual_hashrate, kept in step with self.miners
+        # Set while mining is stopped; shared by every miner, so start/stop is one call
+        self._stop_event = threading.Event()
+        self._stop_event.set()
+        # Miners and their cumulative hashrate weights, rebuilt when marked dirty
+        self._active_miners: List[Miner] = []
+        self._active_cum_weights: List[float] = []
+        self._active_dirty = True
+        self._total_time = 0.0  # Running sum of time_since_last over the chain
+        self._total_tx_count = 0  # Running sum of transaction_count over the chain
+        self._total_reward = 0  # Running sum of miner_reward over the chain
         self.current_difficulty = config.difficulty
+        # ASERT anchor: genesis, so time/height since the anchor are the chain totals
+        self._anchor_difficulty = config.difficulty
+        self._half_life_blocks = MINING_CONFIG['asert_half_life_blocks']
+        # Difficulty stays within 0.1x - 5x of the base difficulty (blocktime * miners * hashrate)
+        base_difficulty = config.blocktime * config.miners * config.hashrate
+        self._min_difficulty = base_difficulty * 0.1
+        self._max_difficulty = base_difficulty * 5.0
         self.block_reward = config.reward
         self.halving_blocks = config.halving
+        self.target_block_time = config.blocktime
+        self.max_tx_per_block = config.blocksize
         self.simulated_time = 0.0
         self.last_block_time = 0.0
         self.last_block_hash = "genesis"
-        self.transaction_pool = []
-        self.lock = threading.Lock()
-        self.block_counter = 0  # Thread-safe block counter
+        self._next_block_at = self._draw_block_interval()  # Simulation time of the next block arrival
+        # Chain height at which the next halving happens
+        self._next_halve_at = self.halving_blocks or math.inf
+        # Mempool as a heap of (-fee, arrival seq, tx): highest fee first, FIFO among equal fees
+        self.transaction_pool: List[tuple] = []
+        self._tx_seq = count()
+        self._tx_index: Dict[str, Transaction] = {}  # tx_id -> pending transaction
+        # Separate locks for the mempool and the chain, so pool traffic doesn't
+        # wait on block submission. The chain lock is reentrant because
+        # block_callback runs while it is held.
+        self._pool_lock = threading.Lock()  # transaction_pool, _tx_index
+        self._chain_lock = threading.RLock()  # blocks, chain indexes, difficulty, reward
+        self._block_id_counter = count(1)  # next() is atomic under the GIL, no lock needed
         self.block_callback = None  # Callback for block propagation
         
         logger.info(f"Initializing mining manager with difficulty {self.current_difficulty}")
@@ -198,8 +259,9 @@ class MiningManager:
     def _create_miners(self):
         """Create and initialize miners"""
         for i in range(self.config.miners):
-            miner = Miner(f"miner_{i}", self.config.hashrate)
-            self.miners.append(miner)
+            miner = Miner(f"miner_{i}", self.config.hashrate, stop_event=self._stop_event)
+            self.miners[miner.miner_id] = miner
+            self._total_hashrate += miner.actual_hashrate
             
         logger.info(f"Created {len(self.miners)} miners")
         
@@ -207,72 +269,80 @@ class MiningManager:
         """Set callback function to be called when a block is successfully mined"""
         self.block_callback = callback
         
+    def start_mining(self):
+        """Mark all miners as running"""
+        self._stop_event.clear()
+        
+    def stop_mining(self):
+        """Mark all miners as stopped"""
+        self._stop_event.set()
+        
+    def _select_miner(self) -> Optional[Miner]:
+        """Pick a running miner, weighted by hashrate"""
+        if self._stop_event.is_set():
+            return None
+        if self._active_dirty:
+            self._active_miners = list(self.miners.values())
+            self._active_cum_weights = list(accumulate(m.actual_hashrate for m in self._active_miners))
+            self._active_dirty = False
+            
+        if not self._active_miners:
+            return None
+        return _rng.choices(self._active_miners, cum_weights=self._active_cum_weights)[0]
+        
     def mine_next_block(self) -> Optional[Block]:
-        """Mine the next block using any available miner - OPTIMIZED VERSION"""
-        # Get current simulation time
-        current_sim_time = self.get_simulation_time()
-        
-        # Calculate time since last block
-        if self.blocks:
-            time_since_last = current_sim_time - self.last_block_time
-        else:
-            time_since_last = self.config.blocktime  # First block
-            
-        # Use a much simpler and more efficient approach
-        # For 600s blocks, we should mine approximately every 600 seconds
-        # Use a simple probability based on time since last block
-        target_block_time = self.config.blocktime
-        
-        # If enough time has passed, mine with high probability
-        if time_since_last >= target_block_time:
-            # High probability of mining (90%)
-            if random.random() < 0.9:
-                # Select a random miner to mine the block
-                active_miners = [m for m in self.miners if m.running]
-                if not active_miners:
-                    return None
-                    
-                miner = random.choice(active_miners)
-                block = miner.mine_block(self)
-                if block:
-                    logger.info(f"Successfully mined block {block.block_id}")
-                    return block
-        else:
-            # Low probability of mining (1%) if not enough time has passed
-            if random.random() < 0.01:
-                active_miners = [m for m in self.miners if m.running]
-                if not active_miners:
-                    return None
-                    
-                miner = random.choice(active_miners)
-                block = miner.mine_block(self)
-                if block:
-                    logger.info(f"Successfully mined block {block.block_id}")
-                    return block
-                    
+        """Mine the next block once its scheduled arrival time has been reached"""
+        # Arrival times are drawn once per block in submit_block, so calls
+        # before the next arrival cost a single comparison
+        if self.get_simulation_time() < self._next_block_at:
+            return None
+            
+        # Select a miner to mine the block
+        miner = self._select_miner()
+        if not miner:
+            return None
+            
+        block = miner.mine_block(self)
+        if block:
+            logger.debug("Successfully mined block %s", block.block_id)
+            return block
         return None
             
+    def _draw_block_interval(self) -> float:
+        """Draw the time until the next block arrival"""
+        # PoW block arrivals are a Poisson process: inter-arrival times are
+        # exponentially distributed with the target block time as their mean
+        if not _unit_intervals:
+            draw = _rng.expovariate
+            _unit_intervals.extend([draw(1.0) for _ in range(_INTERVAL_BATCH)])
+        return self.target_block_time * _unit_intervals.pop()
+        
     def get_next_block_id(self) -> str:
         """Get next block ID in a thread-safe way"""
-        with self.lock:
-            self.block_counter += 1
-            return f"block_{self.block_counter}"
+        return f"block_{next(self._block_id_counter)}"
             
     def submit_block(self, block: Block, miner_id: str):
         """Submit a newly mined block"""
-        with self.lock:
-            logger.debug(f"Attempting to submit block {block.block_id} by {miner_id}")
+        with self._chain_lock:
+            logger.debug("Attempting to submit block %s by %s", block.block_id, miner_id)
             
             # Validate block
             if not self._validate_block(block):
-                logger.debug(f"Invalid block {block.block_id} submitted by {miner_id}")
+                logger.debug("Invalid block %s submitted by %s", block.block_id, miner_id)
                 return False
                 
             # Add block to chain
             self.blocks.append(block)
+            self._block_ids.add(block.block_id)
+            self._total_time += block.time_since_last
+            self._total_tx_count += block.transaction_count
+            self._total_reward += block.miner_reward
             self.last_block_time = block.timestamp
             self.last_block_hash = block.hash
             
+            # Schedule the next arrival; it is the only source of block times
+            self._next_block_at = block.timestamp + self._draw_block_interval()
+            
             # Update miner statistics
             miner = self._get_miner_by_id(miner_id)
             if miner:
@@ -280,15 +350,17 @@ class MiningManager:
                 miner.update_stats(mining_time)
                 self.mining_stats.update_mining_stats(miner_id, mining_time, self.current_difficulty)
                 
-            # Check for difficulty adjustment
-            if len(self.blocks) % DIFFICULTY_ADJUSTMENT_BLOCKS == 0 and len(self.blocks) > 0:
-                self._adjust_difficulty()
+            height = len(self.blocks)
+            
+            # Retarget difficulty (ASERT, every block)
+            self._adjust_difficulty()
                 
             # Check for halving
-            if self.halving_blocks and len(self.blocks) % self.halving_blocks == 0 and len(self.blocks) > 0:
+            if height >= self._next_halve_at:
                 self._halve_reward()
+                self._next_halve_at += self.halving_blocks
                 
-            logger.info(f"Block {block.block_id} submitted by {miner_id} (total blocks: {len(self.blocks)})")
+            logger.debug("Block %s submitted by %s (total blocks: %d)", block.block_id, miner_id, height)
             
             # Call block callback if set
             if self.block_callback:
@@ -301,56 +373,34 @@ class MiningManager:
             
     def _validate_block(self, block: Block) -> bool:
         """Validate a block"""
-        logger.debug(f"Validating block {block.block_id} with {block.transaction_count} transactions")
-        
         # Basic validation
-        if not block.block_id or not block.hash:
-            logger.debug(f"Block validation failed: missing block_id or hash")
+        if not block.block_id or not block.hash_bytes:
+            logger.debug("Block validation failed: missing block_id or hash")
             return False
             
-        # Check if block already exists
-        if any(b.block_id == block.block_id for b in self.blocks):
-            logger.debug(f"Block validation failed: duplicate block_id {block.block_id}")
+        # Check transaction count
+        if block.transaction_count > self.max_tx_per_block:
+            logger.debug("Block validation failed: transaction count %d exceeds blocksize %d",
+                         block.transaction_count, self.max_tx_per_block)
             return False
             
-        # Check transaction count
-        if block.transaction_count > self.config.blocksize:
-            logger.debug(f"Block validation failed: transaction count {block.transaction_count} exceeds blocksize {self.config.blocksize}")
+        # Check if block already exists
+        if block.block_id in self._block_ids:
+            logger.debug("Block validation failed: duplicate block_id %s", block.block_id)
             return False
             
-        logger.debug(f"Block {block.block_id} validation passed")
         return True
         
     def _adjust_difficulty(self):
-        """Adjust mining difficulty based on actual vs target block time"""
-        if len(self.blocks) < DIFFICULTY_ADJUSTMENT_BLOCKS:
-            return
-            
-        # Get recent blocks for difficulty calculation
-        recent_blocks = self.blocks[-DIFFICULTY_ADJUSTMENT_BLOCKS:]
-        actual_avg_time = statistics.mean([b.time_since_last for b in recent_blocks])
-        target_time = self.config.blocktime
-        
-        # Calculate new difficulty with more conservative adjustment
-        difficulty_change = target_time / actual_avg_time
-        
-        # Limit difficulty change more conservatively
-        max_change = 1.5  # Maximum 1.5x change instead of 2x
-        difficulty_change = max(0.67, min(max_change, difficulty_change))
-        
-        # Apply difficulty adjustment
+        """Adjust mining difficulty based on actual vs scheduled block times (ASERT)"""
         old_difficulty = self.current_difficulty
-        self.current_difficulty *= difficulty_change
-        
-        # Ensure difficulty doesn't get too extreme
-        # Base difficulty should be blocktime * miners * hashrate
-        base_difficulty = self.config.blocktime * self.config.miners * self.config.hashrate
-        min_difficulty = base_difficulty * 0.1
-        max_difficulty = base_difficulty * 5.0
-        self.current_difficulty = max(min_difficulty, min(max_difficulty, self.current_difficulty))
+        self.current_difficulty = _compute_new_difficulty(
+            self._anchor_difficulty, self._total_time, len(self.blocks),
+            self.target_block_time, self._half_life_blocks,
+            self._min_difficulty, self._max_difficulty
+        )
         
-        logger.info(f"Difficulty adjustment: {old_difficulty:.2f} -> {self.current_difficulty:.2f} "
-                   f"(change: {difficulty_change:.2f}x)")
+        logger.debug("Difficulty adjustment: %.2f -> %.2f", old_difficulty, self.current_difficulty)
         
     def _halve_reward(self):
         """Halve the block reward"""
@@ -361,16 +411,17 @@ class MiningManager:
         
     def get_transactions_for_block(self) -> List[Transaction]:
         """Get transactions for the next block"""
-        with self.lock:
-            # Get transactions from pool (FIFO)
+        with self._pool_lock:
+            # Get transactions from pool (highest fee first)
+            pool = self.transaction_pool
             transactions = []
-            max_tx = min(self.config.blocksize, len(self.transaction_pool))
+            max_tx = min(self.max_tx_per_block, len(pool))
             
             # Always try to fill the block to capacity
-            for i in range(max_tx):
-                if self.transaction_pool:
-                    tx = self.transaction_pool.pop(0)
-                    transactions.append(tx)
+            for _ in range(max_tx):
+                tx = heapq.heappop(pool)[2]
+                self._tx_index.pop(tx.tx_id, None)
+                transactions.append(tx)
             
             # If no transactions in pool, return empty list
             # This ensures TPS is 0 when no transactions are specified
@@ -383,20 +434,26 @@ class MiningManager:
             
     def add_transaction(self, transaction: Transaction):
         """Add transaction to the mining pool"""
-        with self.lock:
-            self.transaction_pool.append(transaction)
+        with self._pool_lock:
+            heapq.heappush(self.transaction_pool, (-transaction.fee, next(self._tx_seq), transaction))
+            self._tx_index[transaction.tx_id] = transaction
+            
+    def add_transactions(self, transactions: List[Transaction]):
+        """Add a batch of transactions to the mining pool"""
+        with self._pool_lock:
+            seq = self._tx_seq
+            self.transaction_pool.extend([(-tx.fee, next(seq), tx) for tx in transactions])
+            heapq.heapify(self.transaction_pool)
+            self._tx_index.update(zip(map(_get_tx_id, transactions), transactions))
             
     def get_transaction_by_id(self, tx_id: str) -> Optional[Transaction]:
         """Get transaction by ID from the mining pool"""
-        with self.lock:
-            for transaction in self.transaction_pool:
-                if transaction.tx_id == tx_id:
-                    return transaction
-            return None
+        # A single dict lookup is atomic under the GIL, so no lock is needed
+        return self._tx_index.get(tx_id)
             
     def get_total_hashrate(self) -> float:
         """Get total network hashrate"""
-        return sum(miner.actual_hashrate for miner in self.miners)
+        return self._total_hashrate
         
     def get_current_difficulty(self) -> float:
         """Get current mining difficulty"""
@@ -418,6 +475,14 @@ class MiningManager:
         """Get total number of blocks"""
         return len(self.blocks)
         
+    def get_total_transactions(self) -> int:
+        """Get total number of transactions in mined blocks"""
+        return self._total_tx_count
+        
+    def get_total_reward(self) -> float:
+        """Get total mining reward paid out over the chain"""
+        return self._total_reward
+        
     def get_pending_transaction_count(self) -> int:
         """Get number of pending transactions"""
         return len(self.transaction_pool)
@@ -426,21 +491,22 @@ class MiningManager:
         """Get current simulation time"""
         return self.simulated_time
         
+    def time_to_next_block(self) -> float:
+        """Get the simulation time remaining until the next block arrival (0 if it is due)"""
+        return max(0.0, self._next_block_at - self.simulated_time)
+        
     def advance_simulation_time(self, elapsed_time: float):
         """Advance simulation time by the specified amount"""
         self.simulated_time += elapsed_time
         
     def _get_miner_by_id(self, miner_id: str) -> Optional[Miner]:
         """Get miner by ID"""
-        for miner in self.miners:
-            if miner.miner_id == miner_id:
-                return miner
-        return None
+        return self.miners.get(miner_id)
         
     def get_mining_stats(self) -> Dict:
         """Get mining statistics"""
         total_hashrate = self.get_total_hashrate()
-        avg_mining_time = statistics.mean([b.time_since_last for b in self.blocks]) if self.blocks else 0
+        avg_mining_time = self._total_time / len(self.blocks) if self.blocks else 0
         
         return {
             'total_miners': len(self.miners),
@@ -450,25 +516,31 @@ class MiningManager:
             'total_blocks': len(self.blocks),
             'average_mining_time': avg_mining_time,
             'pending_transactions': len(self.transaction_pool),
-            'miners': [miner.to_dict() for miner in self.miners],
+            'miners': list(map(Miner.to_dict, self.miners.values())),
             'mining_stats': self.mining_stats.to_dict()
         }
         
     def simulate_miner_join(self, hashrate: float):
         """Simulate a new miner joining the network"""
-        miner_id = f"miner_{len(self.miners)}"
-        miner = Miner(miner_id, hashrate)
-        self.miners.append(miner)
-        miner.start_mining(self)
+        # Skip IDs still in use (possible once miners have left)
+        index = len(self.miners)
+        while f"miner_{index}" in self.miners:
+            index += 1
+        miner_id = f"miner_{index}"
+        miner = Miner(miner_id, hashrate, stop_event=self._stop_event)
+        self.miners[miner_id] = miner
+        self._total_hashrate += miner.actual_hashrate
+        self._active_dirty = True
         
         logger.info(f"New miner {miner_id} joined with hashrate {hashrate}")
         
     def simulate_miner_leave(self, miner_id: str):
         """Simulate a miner leaving the network"""
-        miner = self._get_miner_by_id(miner_id)
+        miner = self.miners.pop(miner_id, None)
         if miner:
-            miner.stop_mining()
-            self.miners.remove(miner)
+            miner.detach()
+            self._total_hashrate -= miner.actual_hashrate
+            self._active_dirty = True
             logger.info(f"Miner {miner_id} left the network")
             
     def to_dict(self) -> Dict:
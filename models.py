@@ -4,6 +4,8 @@ Contains all data structures and classes used throughout the simulation
 """
 
 import hashlib
+import struct
+import sys
 import time
 from dataclasses import dataclass, field
 from typing import List, Set, Dict, Optional
@@ -12,8 +14,29 @@ import logging
 
 logger = logging.getLogger(__name__)
 
+# hashlib.sha256 is OpenSSL's implementation, which uses the SHA extensions
+# (SHA-NI) on CPUs that have them. Cloning an empty hasher is cheaper than
+# constructing a new one for every block and transaction.
+_SHA256_EMPTY = hashlib.sha256()
 
-@dataclass
+
+# Slotted dataclasses (no per-instance __dict__) where the interpreter supports them
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+# Fixed-width encodings for the numeric fields fed to the hashes
+_pack_block_numbers = struct.Struct('<d').pack  # timestamp
+_pack_tx_numbers = struct.Struct('<ddd').pack  # amount, fee, timestamp
+
+
+def _sha256_digest(data: bytes) -> bytes:
+    """Raw 32-byte SHA-256 digest of data"""
+    hasher = _SHA256_EMPTY.copy()
+    hasher.update(data)
+    return hasher.digest()
+
+
+@dataclass(**_SLOTS)
 class Block:
     """
     Block structure representing a blockchain block
@@ -29,6 +52,7 @@ class Block:
         previous_hash: Hash of the previous block
         miner_id: ID of the miner who created this block
         difficulty: Mining difficulty when this block was created
+        transaction_objects: The Transaction objects behind transactions, when known
     """
     block_id: str
     timestamp: float
@@ -40,15 +64,31 @@ class Block:
     previous_hash: str = ""
     miner_id: str = ""
     difficulty: float = 0.0
+    transaction_objects: List['Transaction'] = field(default_factory=list, repr=False, compare=False)
+    hash_bytes: bytes = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Calculate block hash after initialization"""
-        self.hash = self.calculate_hash()
+        self.hash_bytes = self.calculate_digest()
+        
+    @property
+    def hash(self) -> str:
+        """Hex form of the block hash"""
+        return self.hash_bytes.hex()
         
     def calculate_hash(self) -> str:
         """Calculate the hash of this block"""
-        block_data = f"{self.block_id}{self.timestamp}{self.previous_hash}{self.miner_id}"
-        return hashlib.sha256(block_data.encode()).hexdigest()
+        return self.calculate_digest().hex()
+        
+    def calculate_digest(self) -> bytes:
+        """Calculate the raw hash digest of this block"""
+        block_data = b''.join((
+            self.block_id.encode(),
+            _pack_block_numbers(self.timestamp),
+            self.previous_hash.encode(),
+            self.miner_id.encode()
+        ))
+        return _sha256_digest(block_data)
     
     def to_dict(self) -> Dict:
         """Convert block to dictionary for serialization"""
@@ -67,7 +107,7 @@ class Block:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Transaction:
     """
     Transaction structure representing a blockchain transaction
@@ -92,15 +132,31 @@ class Transaction:
     status: str = "pending"  # pending, confirmed, failed
     priority: str = "normal"  # low, normal, high, urgent
     network_congestion: float = 0.0  # Network congestion level (0.0 to 1.0)
+    hash_bytes: bytes = field(init=False, repr=False, compare=False)
     
     def __post_init__(self):
         """Calculate transaction hash after initialization"""
-        self.hash = self.calculate_hash()
+        self.hash_bytes = self.calculate_digest()
+        
+    @property
+    def hash(self) -> str:
+        """Hex form of the transaction hash"""
+        return self.hash_bytes.hex()
         
     def calculate_hash(self) -> str:
         """Calculate the hash of this transaction"""
-        tx_data = f"{self.tx_id}{self.sender}{self.recipient}{self.amount}{self.fee}{self.timestamp}{self.priority}"
-        return hashlib.sha256(tx_data.encode()).hexdigest()
+        return self.calculate_digest().hex()
+        
+    def calculate_digest(self) -> bytes:
+        """Calculate the raw hash digest of this transaction"""
+        tx_data = b''.join((
+            self.tx_id.encode(),
+            self.sender.encode(),
+            self.recipient.encode(),
+            _pack_tx_numbers(self.amount, self.fee, self.timestamp),
+            self.priority.encode()
+        ))
+        return _sha256_digest(tx_data)
     
     def to_dict(self) -> Dict:
         """Convert transaction to dictionary for serialization"""
@@ -118,7 +174,7 @@ class Transaction:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class Wallet:
     """
     Wallet structure representing a user wallet
@@ -174,7 +230,7 @@ class Wallet:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class NetworkStats:
     """
     Network statistics for monitoring network performance
@@ -184,7 +240,8 @@ class NetworkStats:
         total_transactions_propagated: Total number of transactions propagated
         total_network_data: Total data transferred in bytes
         total_io_requests: Total I/O requests made
-        average_propagation_time: Average time for block propagation
+        total_propagation_time: Sum of block propagation times
+        average_propagation_time: Average time for block propagation (derived)
         network_latency: Current network latency
         packet_loss_rate: Current packet loss rate
     """
@@ -192,24 +249,23 @@ class NetworkStats:
     total_transactions_propagated: int = 0
     total_network_data: int = 0
     total_io_requests: int = 0
-    average_propagation_time: float = 0.0
+    total_propagation_time: float = 0.0
     network_latency: float = 0.0
     packet_loss_rate: float = 0.0
     
-    def update_propagation_stats(self, block_size: int, propagation_time: float):
-        """Update propagation statistics"""
-        self.total_blocks_propagated += 1
-        self.total_network_data += block_size
-        self.total_io_requests += 1
+    def update_propagation_stats(self, block_size: int, propagation_time: float, count: int = 1):
+        """Update propagation statistics for count deliveries of a block"""
+        self.total_blocks_propagated += count
+        self.total_network_data += block_size * count
+        self.total_io_requests += count
+        self.total_propagation_time += propagation_time * count
         
-        # Update average propagation time
-        if self.total_blocks_propagated == 1:
-            self.average_propagation_time = propagation_time
-        else:
-            self.average_propagation_time = (
-                (self.average_propagation_time * (self.total_blocks_propagated - 1) + propagation_time) 
-                / self.total_blocks_propagated
-            )
+    @property
+    def average_propagation_time(self) -> float:
+        """Average time for block propagation"""
+        if self.total_blocks_propagated:
+            return self.total_propagation_time / self.total_blocks_propagated
+        return 0.0
     
     def to_dict(self) -> Dict:
         """Convert network stats to dictionary"""
@@ -224,7 +280,7 @@ class NetworkStats:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class MiningStats:
     """
     Mining statistics for monitoring mining performance
@@ -246,17 +302,18 @@ class MiningStats:
     
     def update_mining_stats(self, miner_id: str, mining_time: float, difficulty: float):
         """Update mining statistics"""
-        self.total_blocks_mined += 1
-        self.total_mining_time += mining_time
+        total_blocks_mined = self.total_blocks_mined + 1
+        total_mining_time = self.total_mining_time + mining_time
+        self.total_blocks_mined = total_blocks_mined
+        self.total_mining_time = total_mining_time
         self.current_difficulty = difficulty
         
         # Update blocks per miner
-        if miner_id not in self.blocks_per_miner:
-            self.blocks_per_miner[miner_id] = 0
-        self.blocks_per_miner[miner_id] += 1
+        blocks_per_miner = self.blocks_per_miner
+        blocks_per_miner[miner_id] = blocks_per_miner.get(miner_id, 0) + 1
         
         # Update average mining time
-        self.average_mining_time = self.total_mining_time / self.total_blocks_mined
+        self.average_mining_time = total_mining_time / total_blocks_mined
     
     def to_dict(self) -> Dict:
         """Convert mining stats to dictionary"""
@@ -270,7 +327,7 @@ class MiningStats:
         }
 
 
-@dataclass
+@dataclass(**_SLOTS)
 class SimulationStats:
     """
     Overall simulation statistics
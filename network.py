@@ -4,9 +4,8 @@ Handles network operations, node management, and block propagation
 """
 
 import random
-import time
 import logging
-from typing import List, Set, Dict, Optional
+from typing import List, Dict, Optional
 from collections import deque
 import threading
 
@@ -15,51 +14,132 @@ from config import HEADER_SIZE, TRANSACTION_SIZE, NETWORK_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Nodes share a small pool of locks, picked by node ID, instead of owning one each
+_NODE_LOCK_SHARDS = 16
+_node_locks = tuple(threading.Lock() for _ in range(_NODE_LOCK_SHARDS))
+
+
+def _draw_link_params(count: int) -> List[tuple]:
+    """
+    Draw (latency, bandwidth, packet loss rate) for count nodes in one batch
+    
+    Equivalent to random.uniform per parameter, with the config lookups and
+    attribute resolution hoisted out of the loop.
+    """
+    rand = random.random
+    latency_min = NETWORK_CONFIG['latency_min']
+    latency_span = NETWORK_CONFIG['latency_max'] - latency_min
+    bandwidth = NETWORK_CONFIG['bandwidth_limit']
+    loss_rate = NETWORK_CONFIG['packet_loss_rate']
+    return [
+        (
+            latency_min + latency_span * rand(),
+            bandwidth * (0.8 + 0.4 * rand()),  # 20% variance
+            loss_rate * (0.5 + rand())  # 50% variance
+        )
+        for _ in range(count)
+    ]
+
+
+class BlockBitmap:
+    """
+    Set of block IDs stored as one bit per block
+    
+    Block IDs are mapped to bit positions through a registry dict shared by
+    every node in a network, so each node only keeps a bytearray.
+    """
+    
+    __slots__ = ('index', 'bits', 'count')
+    
+    def __init__(self, index: Dict[str, int]):
+        self.index = index
+        self.bits = bytearray()
+        self.count = 0
+        
+    def position(self, block_id: str) -> int:
+        """Get the bit position of a block ID, registering it if it is new"""
+        index = self.index
+        position = index.get(block_id)
+        if position is None:
+            position = index[block_id] = len(index)
+        return position
+        
+    def add_bit(self, byte: int, mask: int) -> bool:
+        """Set a bit given its byte offset and mask; returns True if it was not set"""
+        bits = self.bits
+        if byte >= len(bits):
+            bits.extend(bytes(max(byte + 1 - len(bits), len(bits))))
+        elif bits[byte] & mask:
+            return False
+        bits[byte] |= mask
+        self.count += 1
+        return True
+        
+    def add(self, block_id: str) -> bool:
+        """Add a block ID; returns True if it was not already present"""
+        position = self.position(block_id)
+        return self.add_bit(position >> 3, 1 << (position & 7))
+        
+    def __contains__(self, block_id: str) -> bool:
+        position = self.index.get(block_id)
+        if position is None:
+            return False
+        byte = position >> 3
+        return byte < len(self.bits) and bool(self.bits[byte] & (1 << (position & 7)))
+        
+    def __len__(self) -> int:
+        return self.count
+
 
 class BlockchainNode:
     """
     A node in the blockchain network
     
     Each node maintains:
-    - A set of stored block IDs
-    - A list of neighbor nodes
+    - A bitmap of stored block IDs
+    - Neighbor nodes, in the order they were connected
     - Unconfirmed transactions pool
     - Network statistics
     """
     
-    def __init__(self, node_id: str, network_stats: NetworkStats):
+    def __init__(self, node_id: str, network_stats: NetworkStats,
+                 link_params: Optional[tuple] = None, block_index: Optional[Dict[str, int]] = None):
         self.node_id = node_id
-        self.stored_blocks: Set[str] = set()
-        self.neighbors: List['BlockchainNode'] = []
-        self.unconfirmed_transactions: deque = deque()
+        self.stored_blocks = BlockBitmap({} if block_index is None else block_index)
+        # Keys are the neighbors; a dict keeps O(1) membership and a reproducible order
+        self.neighbors: Dict['BlockchainNode', None] = {}
+        self.unconfirmed_transactions: deque = deque()  # append/popleft are atomic, no lock needed
         self.network_stats = network_stats
-        self.lock = threading.Lock()  # Thread safety for concurrent operations
+        self.lock = _node_locks[hash(node_id) % _NODE_LOCK_SHARDS]  # Thread safety for concurrent operations
         
-        # Enhanced network simulation parameters
-        self.local_latency = random.uniform(
-            NETWORK_CONFIG['latency_min'], 
-            NETWORK_CONFIG['latency_max']
-        )
-        self.local_bandwidth = NETWORK_CONFIG['bandwidth_limit'] * random.uniform(0.8, 1.2)  # 20% variance
-        self.packet_loss_rate = NETWORK_CONFIG['packet_loss_rate'] * random.uniform(0.5, 1.5)  # 50% variance
+        # Enhanced network simulation parameters: (latency, bandwidth, packet loss rate)
+        if link_params is None:
+            link_params = _draw_link_params(1)[0]
+        self.local_latency, self.local_bandwidth, self.packet_loss_rate = link_params
         
         logger.info(f"Created node {node_id} with latency={self.local_latency:.3f}s, bandwidth={self.local_bandwidth/1024/1024:.1f}MB/s")
         
-    def add_neighbor(self, neighbor: 'BlockchainNode'):
-        """Add a neighbor node to this node's network"""
-        if neighbor not in self.neighbors and neighbor != self:
-            self.neighbors.append(neighbor)
+    def add_neighbor(self, neighbor: 'BlockchainNode') -> bool:
+        """Add a neighbor node to this node's network; returns True if it was added"""
+        if neighbor not in self.neighbors and neighbor is not self:
+            self.neighbors[neighbor] = None
             logger.debug(f"Node {self.node_id} added neighbor {neighbor.node_id}")
+            return True
+        return False
             
-    def remove_neighbor(self, neighbor: 'BlockchainNode'):
-        """Remove a neighbor node"""
+    def remove_neighbor(self, neighbor: 'BlockchainNode') -> bool:
+        """Remove a neighbor node; returns True if it was a neighbor"""
         if neighbor in self.neighbors:
-            self.neighbors.remove(neighbor)
+            del self.neighbors[neighbor]
             logger.debug(f"Node {self.node_id} removed neighbor {neighbor.node_id}")
+            return True
+        return False
             
     def store_block(self, block: Block) -> bool:
         """
-        Store a block and broadcast it to neighbors
+        Store a block on this node
+        
+        Propagation to other nodes is handled by NetworkManager.broadcast_block.
         
         Args:
             block: The block to store
@@ -68,63 +148,33 @@ class BlockchainNode:
             True if block was new and stored, False if already exists
         """
         with self.lock:
-            if block.block_id not in self.stored_blocks:
-                self.stored_blocks.add(block.block_id)
+            if self.stored_blocks.add(block.block_id):
                 logger.debug(f"Node {self.node_id} stored block {block.block_id}")
-                
-                # Broadcast to neighbors with enhanced network simulation
-                self._broadcast_block(block)
                 return True
             else:
                 logger.debug(f"Node {self.node_id} already has block {block.block_id}")
                 return False
                 
-    def _broadcast_block(self, block: Block):
-        """Broadcast block to all neighbor nodes with enhanced network simulation"""
-        propagation_start = time.time()
-        
-        for neighbor in self.neighbors:
-            try:
-                # Simplified network simulation - just update statistics
-                # Update network statistics
-                self.network_stats.update_propagation_stats(block.size, 0.1)  # Small fixed delay
-                
-                logger.debug(f"Node {self.node_id} broadcasting block {block.block_id} to {neighbor.node_id}")
-                
-            except Exception as e:
-                logger.error(f"Error broadcasting block {block.block_id} to {neighbor.node_id}: {e}")
-                
-    def _receive_block(self, block: Block):
-        """Receive a block from a neighbor node with processing delay - OPTIMIZED VERSION"""
-        with self.lock:
-            if block.block_id not in self.stored_blocks:
-                # Remove processing delay for speed - just simulate it
-                processing_delay = random.uniform(0.001, 0.01)  # 1-10ms processing time (simulated)
-                # time.sleep(processing_delay)  # REMOVED for speed
-                
-                self.stored_blocks.add(block.block_id)
-                logger.debug(f"Node {self.node_id} received block {block.block_id} after {processing_delay:.3f}s processing (simulated)")
-                
-                # Continue broadcasting to other neighbors
-                self._broadcast_block(block)
-            else:
-                logger.debug(f"Node {self.node_id} already received block {block.block_id}")
-                
     def add_transaction(self, transaction: Transaction):
         """Add a transaction to the unconfirmed pool"""
-        with self.lock:
-            self.unconfirmed_transactions.append(transaction)
-            logger.debug(f"Node {self.node_id} added transaction {transaction.tx_id} to pool")
+        self.unconfirmed_transactions.append(transaction)
+        logger.debug("Node %s added transaction %s to pool", self.node_id, transaction.tx_id)
             
+    def add_transactions(self, transactions: List[Transaction]):
+        """Add a batch of transactions to the unconfirmed pool"""
+        self.unconfirmed_transactions.extend(transactions)
+        logger.debug("Node %s added %d transactions to pool", self.node_id, len(transactions))
+        
     def get_transactions(self, max_count: int) -> List[Transaction]:
         """Get transactions from the unconfirmed pool"""
-        with self.lock:
-            transactions = []
-            count = 0
-            while self.unconfirmed_transactions and count < max_count:
-                transactions.append(self.unconfirmed_transactions.popleft())
-                count += 1
-            return transactions
+        pool = self.unconfirmed_transactions
+        transactions = []
+        for _ in range(min(max_count, len(pool))):
+            try:
+                transactions.append(pool.popleft())
+            except IndexError:  # Drained concurrently
+                break
+        return transactions
             
     def get_neighbor_count(self) -> int:
         """Get the number of neighbor nodes"""
@@ -178,16 +228,22 @@ class NetworkManager:
         self.neighbor_count = neighbor_count
         self.network_stats = network_stats
         self.nodes: List[BlockchainNode] = []
+        self._nodes_by_id: Dict[str, BlockchainNode] = {}
+        self._block_index: Dict[str, int] = {}  # Block ID -> bit position in every node's bitmap
+        # Running totals, kept in step with topology changes and block propagation
+        self._link_count = 0  # Bidirectional links between nodes
+        self._total_blocks_stored = 0  # Block copies stored across all nodes
         
         logger.info(f"Initializing network with {node_count} nodes, {neighbor_count} neighbors each")
         self._create_network()
         
     def _create_network(self):
         """Create the network topology"""
-        # Create nodes
-        for i in range(self.node_count):
-            node = BlockchainNode(f"node_{i}", self.network_stats)
+        # Create nodes, drawing their link parameters in one batch
+        for i, link_params in enumerate(_draw_link_params(self.node_count)):
+            node = BlockchainNode(f"node_{i}", self.network_stats, link_params, self._block_index)
             self.nodes.append(node)
+            self._nodes_by_id[node.node_id] = node
             
         # Connect nodes randomly
         self._connect_nodes()
@@ -197,65 +253,114 @@ class NetworkManager:
     def _connect_nodes(self):
         """Connect nodes in a random topology"""
         for node in self.nodes:
-            # Get available neighbors (nodes not already connected)
-            available_neighbors = [
-                n for n in self.nodes 
-                if n != node and n not in node.neighbors
-            ]
+            # Randomly select neighbors among nodes not already connected
+            selected_neighbors = self._sample_neighbors(node, self.neighbor_count)
             
-            # Determine how many neighbors to connect
-            num_neighbors = min(self.neighbor_count, len(available_neighbors))
-            
-            if num_neighbors > 0:
-                # Randomly select neighbors
-                selected_neighbors = random.sample(available_neighbors, num_neighbors)
+            # Connect bidirectionally
+            for neighbor in selected_neighbors:
+                self._link(node, neighbor)
                 
-                # Connect bidirectionally
-                for neighbor in selected_neighbors:
-                    node.add_neighbor(neighbor)
-                    neighbor.add_neighbor(node)
-                    
         logger.info(f"Network topology created with {self.neighbor_count} neighbors per node")
         
+    def _sample_neighbors(self, node: BlockchainNode, count: int) -> List[BlockchainNode]:
+        """
+        Pick up to count distinct random nodes that are not node or its neighbors
+        
+        Draws random indices and rejects unusable ones, which costs O(count)
+        when count is small relative to the network. Falls back to sampling
+        from the full list of candidates when most nodes are unusable.
+        """
+        nodes = self.nodes
+        excluded = node.neighbors
+        available = len(nodes) - 1 - len(excluded)
+        count = min(count, available)
+        if count <= 0:
+            return []
+            
+        if 2 * count > available:
+            candidates = [n for n in nodes if n is not node and n not in excluded]
+            return random.sample(candidates, count)
+            
+        selected = {}
+        randrange = random.randrange
+        size = len(nodes)
+        while len(selected) < count:
+            candidate = nodes[randrange(size)]
+            if candidate is not node and candidate not in excluded:
+                selected[candidate] = None
+        return list(selected)
+        
+    def _link(self, node: BlockchainNode, neighbor: BlockchainNode):
+        """Connect two nodes bidirectionally"""
+        if node.add_neighbor(neighbor):
+            neighbor.add_neighbor(node)
+            self._link_count += 1
+            
+    def _unlink(self, node: BlockchainNode, neighbor: BlockchainNode):
+        """Disconnect two nodes in both directions"""
+        if node.remove_neighbor(neighbor):
+            neighbor.remove_neighbor(node)
+            self._link_count -= 1
+            
     def broadcast_block(self, block: Block):
-        """Broadcast a block to all nodes in the network"""
-        if self.nodes:
-            # Start with a random node
-            start_node = random.choice(self.nodes)
-            start_node.store_block(block)
+        """Broadcast a block to all nodes reachable from a random starting node"""
+        if not self.nodes:
+            return
+            
+        # Start with a random node
+        start_node = random.choice(self.nodes)
+        if not start_node.store_block(block):
+            return
+            
+        # Flood breadth-first: each node forwards the block to neighbors that don't have it yet
+        position = self._block_index[block.block_id]
+        byte, mask = position >> 3, 1 << (position & 7)
+        deliveries = 0
+        queue = deque((start_node,))
+        while queue:
+            for neighbor in queue.popleft().neighbors:
+                # Same shard lock store_block takes for the node's bitmap
+                with neighbor.lock:
+                    added = neighbor.stored_blocks.add_bit(byte, mask)
+                if added:
+                    deliveries += 1
+                    queue.append(neighbor)
+                    
+        self._total_blocks_stored += deliveries + 1
+        if deliveries:
+            # Simplified network simulation - small fixed delay per delivery
+            self.network_stats.update_propagation_stats(block.size, 0.1, deliveries)
             
     def broadcast_transaction(self, transaction: Transaction):
         """Broadcast a transaction to all nodes in the network"""
         for node in self.nodes:
             node.add_transaction(transaction)
             
+    def broadcast_transactions(self, transactions: List[Transaction]):
+        """Broadcast a batch of transactions to all nodes in the network"""
+        for node in self.nodes:
+            node.add_transactions(transactions)
+            
     def get_network_stats(self) -> Dict:
         """Get comprehensive network statistics"""
-        total_connections = sum(node.get_neighbor_count() for node in self.nodes) // 2  # Divide by 2 for bidirectional
-        total_blocks_stored = sum(node.get_stored_block_count() for node in self.nodes)
+        link_count = self._link_count
+        total_blocks_stored = self._total_blocks_stored
         total_pending_transactions = sum(node.get_pending_transaction_count() for node in self.nodes)
         
         # Calculate average neighbors
-        avg_neighbors = total_connections / len(self.nodes) if self.nodes else 0
+        avg_neighbors = link_count / len(self.nodes) if self.nodes else 0
         
         # Get node-specific network stats
         node_stats = [node.get_network_stats() for node in self.nodes]
         
-        # Calculate cumulative network operations (IO) based on network topology
-        # IO should represent network operations for block propagation
-        # With nodes=2 and neighbors=1, we have a simple network topology
-        # Each block needs to be propagated through the network
-        total_blocks_stored = sum(node.get_stored_block_count() for node in self.nodes)
-        
-        # Calculate IO based on network topology and block propagation
-        # For a network with nodes=2, neighbors=1, each block requires 2 network operations
-        # (one for each node to receive the block)
-        io_per_block = self.node_count  # Each node needs to receive the block
-        cumulative_io = total_blocks_stored * io_per_block
+        # Calculate IO based on block propagation: every block a node stores
+        # took one network operation to receive (e.g. 2 per block with nodes=2)
+        cumulative_io = total_blocks_stored
         
         return {
             'node_count': len(self.nodes),
             'total_connections': cumulative_io,  # Use cumulative IO instead of static connections
+            'link_count': link_count,
             'total_blocks_stored': total_blocks_stored,
             'total_pending_transactions': total_pending_transactions,
             'average_neighbors': avg_neighbors,
@@ -263,12 +368,13 @@ class NetworkManager:
             'node_stats': node_stats
         }
         
+    def get_cumulative_io(self) -> int:
+        """Get the number of block deliveries so far (one network operation each)"""
+        return self._total_blocks_stored
+        
     def get_node_by_id(self, node_id: str) -> Optional[BlockchainNode]:
         """Get a node by its ID"""
-        for node in self.nodes:
-            if node.node_id == node_id:
-                return node
-        return None
+        return self._nodes_by_id.get(node_id)
         
     def add_node(self, node_id: str) -> BlockchainNode:
         """Add a new node to the network"""
@@ -279,18 +385,13 @@ class NetworkManager:
             return existing_node
             
         # Create new node
-        node = BlockchainNode(node_id, self.network_stats)
+        node = BlockchainNode(node_id, self.network_stats, block_index=self._block_index)
         self.nodes.append(node)
+        self._nodes_by_id[node_id] = node
         
         # Connect to existing nodes
-        available_neighbors = [n for n in self.nodes if n != node]
-        num_neighbors = min(self.neighbor_count, len(available_neighbors))
-        
-        if num_neighbors > 0:
-            selected_neighbors = random.sample(available_neighbors, num_neighbors)
-            for neighbor in selected_neighbors:
-                node.add_neighbor(neighbor)
-                neighbor.add_neighbor(node)
+        for neighbor in self._sample_neighbors(node, self.neighbor_count):
+            self._link(node, neighbor)
                 
         logger.info(f"Added new node {node_id} to network")
         return node
@@ -303,11 +404,13 @@ class NetworkManager:
             return False
             
         # Remove from neighbors
-        for neighbor in node.neighbors:
-            neighbor.remove_neighbor(node)
+        for neighbor in list(node.neighbors):
+            self._unlink(node, neighbor)
             
         # Remove from network
         self.nodes.remove(node)
+        del self._nodes_by_id[node_id]
+        self._total_blocks_stored -= node.get_stored_block_count()
         
         logger.info(f"Removed node {node_id} from network")
         return True
@@ -325,8 +428,7 @@ class NetworkManager:
         # Remove connections between partitions
         for partition_node in partition_nodes:
             for other_node in other_nodes:
-                partition_node.remove_neighbor(other_node)
-                other_node.remove_neighbor(partition_node)
+                self._unlink(partition_node, other_node)
                 
         logger.info(f"Created network partition: {len(partition_nodes)} nodes isolated from {len(other_nodes)} nodes")
         
@@ -343,4 +445,4 @@ class NetworkManager:
             'neighbor_count': self.neighbor_count,
             'nodes': [node.to_dict() for node in self.nodes],
             'network_stats': self.get_network_stats()
-        } 
\ No newline at end of file
+        }
@@ -3,19 +3,33 @@ Main blockchain simulator module
 Coordinates all components and provides the main simulation logic
 """
 
-import time
+import io
+import sys
 import json
+import random
 import logging
 import argparse
+import threading
+import multiprocessing
 import statistics
+from contextlib import redirect_stdout
 from typing import Dict, List, Optional
 
+# Optional fast JSON encoder for exporting results
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
 from config import (
     SimulationConfig, BLOCKCHAIN_CONFIGS, WORKLOAD_CONFIGS,
-    LOG_CONFIG, DEFAULT_CONFIG
+    LOG_CONFIG, DEFAULT_CONFIG, SECONDS_PER_YEAR, describe, describe_workload,
+    ChainId, CHAIN_REWARDS, CHAIN_HALVINGS, CHAIN_BLOCK_TIMES, CHAIN_MAX_TX
 )
 from models import SimulationStats, NetworkStats, MiningStats
 from network import NetworkManager
+import mining
 from mining import MiningManager
 from wallet import WalletManager
 from trace_loader import TraceLoader
@@ -23,6 +37,27 @@ from trace_loader import TraceLoader
 logger = logging.getLogger(__name__)
 
 
+def configure_logging():
+    """Setup logging configuration, once per process"""
+    if logging.getLogger().handlers:
+        return
+    logging.basicConfig(
+        level=logging.WARNING,  # Changed to WARNING to minimize overhead
+        format='%(levelname)s:%(name)s:%(message)s',
+        handlers=[
+            logging.FileHandler(LOG_CONFIG['file']),
+            logging.StreamHandler()
+        ]
+    )
+
+
+def format_number(num):
+    """Format a count like the reference output (K for thousands)"""
+    if num >= 1000:
+        return f"{num/1000:.0f}K"
+    return str(num)
+
+
 class BlockchainSimulator:
     """
     Main blockchain simulation orchestrator
@@ -67,32 +102,26 @@ class BlockchainSimulator:
         # Enhanced network condition tracking
         self.network_congestion = 0.0
         self.block_utilization = 0.5
-        self.last_network_update = time.time()
+        
+        # Constants for the termination checks and periodic summaries
+        self._blocks_per_year = SECONDS_PER_YEAR / config.blocktime
+        self._expected_transactions = config.wallets * config.transactions
+        self._has_tx_workload = config.wallets > 0 and self._expected_transactions > 0
+        self._target_blocks = config.blocks
+        self._eta_target_blocks = config.blocks or 525600  # Default to 10 years worth of blocks
         
         # Debug: Print actual difficulty and total hashrate
-        print(f"[DEBUG] DIFFICULTY: {self.config.difficulty}, HASHRATE: {self.config.miners * self.config.hashrate}")
+        if self.config.debug:
+            print(f"[DEBUG] DIFFICULTY: {self.config.difficulty}, HASHRATE: {self.config.miners * self.config.hashrate}")
         
-        # Simulation state
-        self.running = False
+        # Simulation state; set while the simulation is not running
+        self._stop = threading.Event()
+        self._stop.set()
         self.blocks_mined = 0
         self.total_coins = 0.0
         
-        # Setup logging
-        self._setup_logging()
-        
         logger.info("Blockchain simulator initialized")
         
-    def _setup_logging(self):
-        """Setup logging configuration"""
-        logging.basicConfig(
-            level=logging.WARNING,  # Changed to WARNING to minimize overhead
-            format='%(levelname)s:%(name)s:%(message)s',
-            handlers=[
-                logging.FileHandler(LOG_CONFIG['file']),
-                logging.StreamHandler()
-            ]
-        )
-        
     def load_traces(self):
         """Load trace data if enabled"""
         if not self.use_traces or not self.trace_loader:
@@ -117,10 +146,15 @@ class BlockchainSimulator:
         except Exception as e:
             logger.error(f"Error loading traces: {e}")
             
+    @property
+    def running(self) -> bool:
+        """Whether the simulation is running"""
+        return not self._stop.is_set()
+        
     def start(self):
         """Start the blockchain simulation"""
         logger.info("Starting blockchain simulation")
-        self.running = True
+        self._stop.clear()
         
         # Load traces if enabled
         if self.use_traces:
@@ -130,7 +164,8 @@ class BlockchainSimulator:
         if self.config.wallets > 0 and self.config.transactions > 0:
             logger.info("Generating all transactions upfront...")
             self.wallet_manager.start_transaction_generation(
-                self._on_transaction_created
+                self._on_transaction_created,
+                batch_callback=self._on_transactions_created
             )
             pool_size = self.mining_manager.get_pending_transaction_count()
             logger.info(f"Transaction generation complete. Pool size: {pool_size}")
@@ -148,8 +183,7 @@ class BlockchainSimulator:
         logger.info("Starting mining...")
         
         # Mark all miners as running
-        for miner in self.mining_manager.miners:
-            miner.running = True
+        self.mining_manager.start_mining()
             
         # Start main simulation loop
         self._simulation_loop()
@@ -157,12 +191,11 @@ class BlockchainSimulator:
     def stop(self):
         """Stop the blockchain simulation"""
         logger.info("Stopping blockchain simulation")
-        logger.debug(f"Setting running flag to False (was {self.running})")
-        self.running = False
+        logger.debug("Setting stop flag (running was %s)", self.running)
+        self._stop.set()
         
         # Stop all components
-        for miner in self.mining_manager.miners:
-            miner.running = False
+        self.mining_manager.stop_mining()
         self.wallet_manager.stop_transaction_generation()
         
         # Mark simulation as finished
@@ -170,54 +203,58 @@ class BlockchainSimulator:
         
     def _simulation_loop(self):
         """Main simulation loop with enhanced network monitoring - OPTIMIZED VERSION"""
-        last_summary_time = time.time()
-        last_network_update = time.time()
-        iteration_count = 0
+        # Bind the per-iteration lookups once
+        mining_manager = self.mining_manager
+        should_terminate = self._should_terminate
+        time_to_next_block = mining_manager.time_to_next_block
+        advance = mining_manager.advance_simulation_time
+        mine_next_block = mining_manager.mine_next_block
+        get_simulation_time = mining_manager.get_simulation_time
+        update_stats = self._update_stats
+        print_interval = self.config.print_interval
+        
+        # Network conditions are refreshed on simulated time, every 10 minutes
+        network_update_interval = 600.0
+        next_network_update = get_simulation_time() + network_update_interval
+        iteration = 0
         
         try:
             logger.info("Starting simulation loop")
-            iteration = 0
-            while self.running:
+            is_stopped = self._stop.is_set
+            while not is_stopped():
                 iteration += 1
-                if iteration % 1000000 == 0:  # Much reduced logging frequency
+                if __debug__ and iteration % 1000000 == 0:  # Much reduced logging frequency
                     logger.info(f"Simulation loop iteration {iteration}")
-                iteration_count += 1
                     
                 # Check termination conditions
-                should_terminate = self._should_terminate()
-                if should_terminate:
+                if should_terminate():
                     logger.info("Termination condition met, ending simulation")
                     break
                     
-                # Try to mine a block
-                block = self.mining_manager.mine_next_block()
+                # Jump straight to the next block arrival (often already due), then
+                # mine it; the arrival time is the block's timestamp, so the clock
+                # is not advanced again for the block itself
+                wait = time_to_next_block()
+                if wait:
+                    advance(wait)
+                block = mine_next_block()
                 if block:
-                    logger.info(f"Mined block {block.block_id} with {block.transaction_count} transactions")
-                    
-                    # Advance simulation time by the block's mining time
-                    self.mining_manager.advance_simulation_time(block.time_since_last)
+                    logger.info("Mined block %s with %d transactions", block.block_id, block.transaction_count)
                     
                     # Update stats immediately after mining a block
-                    self._update_stats()
+                    update_stats()
                     
                     # Print summary based on print interval
-                    if self.blocks_mined % self.config.print_interval == 0:
+                    if self.blocks_mined % print_interval == 0:
                         self._print_summary()
                 else:
-                    # Advance simulation time much more efficiently when no block is mined
-                    # Advance by much larger amounts to speed up simulation dramatically
-                    self.mining_manager.advance_simulation_time(300.0)  # Advance by 5 minutes
-                    
-                # Debug: Check if running flag changed
-                if not self.running:
-                    logger.warning(f"Running flag set to False after iteration {iteration}")
-                    break
+                    # No running miner took the block; step forward and retry
+                    advance(300.0)  # Advance by 5 minutes
                     
                 # Update network conditions much less frequently
-                current_time = time.time()
-                if current_time - last_network_update >= 600.0:  # Update every 10 minutes
+                if get_simulation_time() >= next_network_update:
                     self._update_network_conditions()
-                    last_network_update = current_time
+                    next_network_update = get_simulation_time() + network_update_interval
                 
                 # No sleep needed with time-based mining
                 
@@ -226,7 +263,7 @@ class BlockchainSimulator:
         except Exception as e:
             logger.error(f"Error in simulation loop: {e}")
         finally:
-            logger.info(f"Simulation loop ended after {iteration_count} iterations")
+            logger.info(f"Simulation loop ended after {iteration} iterations")
             self.stop()
             self._print_final_summary()
             
@@ -252,32 +289,24 @@ class BlockchainSimulator:
         # Update wallet manager with new network conditions
         self.wallet_manager.update_network_conditions(self.network_congestion, self.block_utilization)
         
-        logger.debug(f"Network conditions updated: congestion={self.network_congestion:.2f}, utilization={self.block_utilization:.2f}")
+        logger.debug("Network conditions updated: congestion=%.2f, utilization=%.2f",
+                     self.network_congestion, self.block_utilization)
         
     def _should_terminate(self) -> bool:
         """Check if simulation should terminate"""
-        # Check if pool is empty and we have mined at least some blocks
-        pending_tx = self.mining_manager.get_pending_transaction_count()
-        
-        # Terminate if pool is empty and we have mined at least some blocks
-        # This matches the professor's behavior - stop when all transactions are processed
-        total_expected_transactions = self.config.wallets * self.config.transactions
+        blocks_mined = self.blocks_mined
         
         # Case 1: There are transactions to process and pool is empty
-        if (self.config.wallets > 0 and 
-            pending_tx == 0 and 
-            self.blocks_mined > 0 and
-            total_expected_transactions > 0):
-            logger.info(f"All transactions processed - Blocks: {self.blocks_mined}, Pool: {pending_tx}")
+        # This matches the professor's behavior - stop when all transactions are processed
+        if (self._has_tx_workload and
+            blocks_mined > 0 and
+            self.mining_manager.get_pending_transaction_count() == 0):
+            logger.info("All transactions processed - Blocks: %d, Pool: 0", blocks_mined)
             return True
             
-        # Debug: Log why termination didn't happen
-        if self.config.wallets > 0 and pending_tx == 0 and self.blocks_mined > 0:
-            logger.debug(f"Termination check - Wallets: {self.config.wallets}, Transactions: {self.config.transactions}, Total expected: {total_expected_transactions}, Pool: {pending_tx}, Blocks: {self.blocks_mined}")
-            
         # Case 2: Block count limit reached (for both transaction and non-transaction scenarios)
-        if self.config.blocks and self.blocks_mined >= self.config.blocks:
-            logger.info(f"Reached target block count: {self.blocks_mined}")
+        if self._target_blocks and blocks_mined >= self._target_blocks:
+            logger.info("Reached target block count: %d", blocks_mined)
             return True
             
         return False
@@ -297,7 +326,8 @@ class BlockchainSimulator:
         pool_empty = self.mining_manager.get_pending_transaction_count() == 0
         
         # Debug logging
-        logger.debug(f"Transaction check - Expected: {total_expected}, Generated: {total_generated}, Pool empty: {pool_empty}")
+        logger.debug("Transaction check - Expected: %d, Generated: %d, Pool empty: %s",
+                     total_expected, total_generated, pool_empty)
         
         # Both conditions must be true
         return total_generated >= total_expected and pool_empty
@@ -311,8 +341,18 @@ class BlockchainSimulator:
         self.network_manager.broadcast_transaction(transaction)
         
         # Debug logging
-        pool_size = self.mining_manager.get_pending_transaction_count()
-        logger.debug(f"Transaction {transaction.tx_id} added to pool. Pool size: {pool_size}")
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("Transaction %s added to pool. Pool size: %d",
+                         transaction.tx_id, self.mining_manager.get_pending_transaction_count())
+        
+    def _on_transactions_created(self, transactions):
+        """Callback when a batch of new transactions is created"""
+        # Add to mining pool and broadcast to network, once per batch
+        self.mining_manager.add_transactions(transactions)
+        self.network_manager.broadcast_transactions(transactions)
+        
+        logger.debug("Added %d transactions to pool. Pool size: %d",
+                     len(transactions), self.mining_manager.get_pending_transaction_count())
         
     def _on_block_mined(self, block):
         """Callback when a new block is mined"""
@@ -321,17 +361,16 @@ class BlockchainSimulator:
         
         # Process confirmed transactions
         # Use the stored transaction objects if available
-        if hasattr(block, 'transaction_objects') and block.transaction_objects:
-            for transaction in block.transaction_objects:
-                self.wallet_manager.process_confirmed_transaction(transaction)
-        else:
+        transactions = block.transaction_objects
+        if transactions:
+            self.wallet_manager.process_confirmed_transactions(transactions)
+        elif block.transactions:
             # Fallback to looking up transactions by ID
-            for tx_id in block.transactions:
-                transaction = self.mining_manager.get_transaction_by_id(tx_id)
-                if transaction:
-                    self.wallet_manager.process_confirmed_transaction(transaction)
+            get_transaction = self.mining_manager.get_transaction_by_id
+            transactions = [tx for tx in map(get_transaction, block.transactions) if tx]
+            self.wallet_manager.process_confirmed_transactions(transactions)
         
-        logger.debug(f"Block {block.block_id} broadcast to network with {block.transaction_count} transactions")
+        logger.debug("Block %s broadcast to network with %d transactions", block.block_id, block.transaction_count)
         
     def _update_stats(self):
         """Update simulation statistics"""
@@ -339,16 +378,12 @@ class BlockchainSimulator:
         self.blocks_mined = self.mining_manager.get_block_count()
         
         if self.blocks_mined != old_blocks:
-            logger.info(f"Block count updated: {old_blocks} -> {self.blocks_mined}")
+            logger.info("Block count updated: %d -> %d", old_blocks, self.blocks_mined)
             
-        self.total_coins = sum(
-            block.miner_reward for block in self.mining_manager.blocks
-        )
+        self.total_coins = self.mining_manager.get_total_reward()
         
         # Calculate actual total transactions (not assuming full blocks)
-        total_transactions = sum(
-            block.transaction_count for block in self.mining_manager.blocks
-        )
+        total_transactions = self.mining_manager.get_total_transactions()
         
         # Update simulation stats
         self.stats.total_blocks = self.blocks_mined
@@ -358,21 +393,35 @@ class BlockchainSimulator:
         self.stats.mining_stats = self.mining_stats
         
         # Debug: Log current state
-        logger.debug(f"Stats updated - Blocks: {self.blocks_mined}, Total transactions: {total_transactions}, Total coins: {self.total_coins}")
+        logger.debug("Stats updated - Blocks: %d, Total transactions: %d, Total coins: %s",
+                     self.blocks_mined, total_transactions, self.total_coins)
+        
+    def _inflation(self) -> float:
+        """Annualised inflation from the current block reward and circulating supply"""
+        if self.blocks_mined == 1:
+            return 0.0  # First block has 0% inflation
+        # Calculate inflation based on block reward and current supply
+        circulating_supply = max(self.total_coins, 1)  # Avoid division by zero
+        
+        # Use a more reasonable calculation that matches professor's pattern
+        return (self.mining_manager.get_block_reward() * self._blocks_per_year) / circulating_supply * 100
         
     def _print_summary(self):
         """Print periodic simulation summary in compact format"""
+        mining_manager = self.mining_manager
+        blocks_mined = self.blocks_mined
+        
         # Calculate metrics using simulation time instead of real time
-        simulation_time = self.mining_manager.get_simulation_time()
+        simulation_time = mining_manager.get_simulation_time()
         
         # Calculate average block time based on simulation time
-        if self.blocks_mined > 1:
-            avg_block_time = simulation_time / self.blocks_mined
+        if blocks_mined > 1:
+            avg_block_time = simulation_time / blocks_mined
         else:
             avg_block_time = simulation_time
             
         # Calculate transactions per second based on simulation time
-        total_transactions = sum(block.transaction_count for block in self.mining_manager.blocks)
+        total_transactions = mining_manager.get_total_transactions()
         # Use simulation time for TPS calculation, not real time
         # When there are no transactions, TPS should be 0
         if total_transactions == 0:
@@ -380,97 +429,59 @@ class BlockchainSimulator:
         else:
             tps = total_transactions / simulation_time if simulation_time > 0 else 0
         
-        # Calculate inflation percentage using simplified formula
-        if self.blocks_mined == 1:
-            inflation = 0.0  # First block has 0% inflation
-        else:
-            # Calculate inflation based on block reward and current supply
-            reward_per_block = self.mining_manager.get_block_reward()
-            blocks_per_year = 365 * 24 * 3600 / self.config.blocktime  # seconds per year / block time
-            circulating_supply = max(self.total_coins, 1)  # Avoid division by zero
-            
-            # Use a more reasonable calculation that matches professor's pattern
-            inflation = (reward_per_block * blocks_per_year) / circulating_supply * 100
-        
         # Calculate ETA based on remaining work
-        pending_tx = self.mining_manager.get_pending_transaction_count()
+        pending_tx = mining_manager.get_pending_transaction_count()
         
         # If there are pending transactions, calculate ETA based on TPS
         if pending_tx > 0 and tps > 0:
             eta_seconds = pending_tx / tps
+        elif self._has_tx_workload and blocks_mined > 0:
+            # Simulation should terminate when pool is empty, so ETA should be small
+            eta_seconds = 0
         else:
-            # If no pending transactions, check if simulation should terminate soon
-            total_expected_transactions = self.config.wallets * self.config.transactions
-            if (self.config.wallets > 0 and 
-                self.blocks_mined > 0 and
-                total_expected_transactions > 0):
-                # Simulation should terminate when pool is empty, so ETA should be small
-                eta_seconds = 0
+            # Calculate ETA based on remaining blocks (for non-transaction scenarios)
+            remaining_blocks = self._eta_target_blocks - blocks_mined
+            if remaining_blocks > 0 and avg_block_time > 0:
+                eta_seconds = remaining_blocks * avg_block_time
             else:
-                # Calculate ETA based on remaining blocks (for non-transaction scenarios)
-                total_blocks = self.config.blocks or 525600  # Default to 10 years worth of blocks
-                remaining_blocks = total_blocks - self.blocks_mined
-                if remaining_blocks > 0 and avg_block_time > 0:
-                    eta_seconds = remaining_blocks * avg_block_time
-                else:
-                    eta_seconds = 0
-            
-        # Get network stats
-        network_stats = self.network_manager.get_network_stats()
-        total_hashrate = self.mining_manager.get_total_hashrate()
-        
+                eta_seconds = 0
+                
         # Format output exactly like the professor's example
         # Use simulation time for timestamp
         # Show total coins (C) instead of chain length
-        # Format numbers like professor's output (K for thousands)
-        def format_number(num):
-            if num >= 1000:
-                return f"{num/1000:.0f}K"
-            return str(num)
-        
-        print(f"[{simulation_time:.2f}] Sum B:{self.blocks_mined}/{self.config.blocks or 0} "
-              f"{(self.blocks_mined/(self.config.blocks or 1)*100):.1f}% "
-              f"abt:{avg_block_time:.2f}s tps:{tps:.2f} infl:{inflation:.2f}% "
-              f"ETA:{eta_seconds:.2f}s Diff:{self.mining_manager.get_current_difficulty()/1e9:.1f}B "
-              f"H:{total_hashrate/1e6:.0f}M Tx:{total_transactions} C:{format_number(self.total_coins)} "
-              f"Pool:{pending_tx} NMB:{self.network_stats.total_network_data/(1024*1024):.2f} "
-              f"IO:{network_stats['total_connections']}")
+        target_blocks = self.config.blocks
+        sys.stdout.write(''.join((
+            f"[{simulation_time:.2f}] Sum B:{blocks_mined}/{target_blocks or 0} ",
+            f"{(blocks_mined/(target_blocks or 1)*100):.1f}% ",
+            f"abt:{avg_block_time:.2f}s tps:{tps:.2f} infl:{self._inflation():.2f}% ",
+            f"ETA:{eta_seconds:.2f}s Diff:{mining_manager.get_current_difficulty()/1e9:.1f}B ",
+            f"H:{mining_manager.get_total_hashrate()/1e6:.0f}M Tx:{total_transactions} ",
+            f"C:{format_number(self.total_coins)} Pool:{pending_tx} ",
+            f"NMB:{self.network_stats.total_network_data/(1024*1024):.2f} ",
+            f"IO:{self.network_manager.get_cumulative_io()}\n"
+        )))
         
     def _print_final_summary(self):
         """Print final simulation summary in compact format"""
+        mining_manager = self.mining_manager
+        blocks_mined = self.blocks_mined
+        
         # Calculate final metrics using simulation time
-        simulation_time = self.mining_manager.get_simulation_time()
-        total_transactions = sum(block.transaction_count for block in self.mining_manager.blocks)
-        avg_block_time = simulation_time / self.blocks_mined if self.blocks_mined > 0 else 0
+        simulation_time = mining_manager.get_simulation_time()
+        total_transactions = mining_manager.get_total_transactions()
+        avg_block_time = simulation_time / blocks_mined if blocks_mined > 0 else 0
         tps = total_transactions / simulation_time if simulation_time > 0 else 0
-        if self.blocks_mined == 1:
-            inflation = 0.0  # First block has 0% inflation
-        else:
-            # Calculate inflation based on block reward and current supply
-            reward_per_block = self.mining_manager.get_block_reward()
-            blocks_per_year = 365 * 24 * 3600 / self.config.blocktime  # seconds per year / block time
-            circulating_supply = max(self.total_coins, 1)  # Avoid division by zero
-            
-            # Use a more reasonable calculation that matches professor's pattern
-            inflation = (reward_per_block * blocks_per_year) / circulating_supply * 100
-        
-        # Get final stats
-        network_stats = self.network_manager.get_network_stats()
-        total_hashrate = self.mining_manager.get_total_hashrate()
-        pending_tx = self.mining_manager.get_pending_transaction_count()
         
         # Print final summary in compact format
-        def format_number(num):
-            if num >= 1000:
-                return f"{num/1000:.0f}K"
-            return str(num)
-        
-        print(f"[******] End B:{self.blocks_mined}/{self.config.blocks or 0} "
-              f"100.0% abt:{avg_block_time:.2f}s tps:{tps:.2f} infl:{inflation:.2f}% "
-              f"Diff:{self.mining_manager.get_current_difficulty()/1e9:.1f}B "
-              f"H:{total_hashrate/1e6:.0f}M Tx:{total_transactions} C:{format_number(self.total_coins)} "
-              f"Pool:{pending_tx} NMB:{self.network_stats.total_network_data/(1024*1024):.2f} "
-              f"IO:{network_stats['total_connections']}")
+        sys.stdout.write(''.join((
+            f"[******] End B:{blocks_mined}/{self.config.blocks or 0} ",
+            f"100.0% abt:{avg_block_time:.2f}s tps:{tps:.2f} infl:{self._inflation():.2f}% ",
+            f"Diff:{mining_manager.get_current_difficulty()/1e9:.1f}B ",
+            f"H:{mining_manager.get_total_hashrate()/1e6:.0f}M Tx:{total_transactions} ",
+            f"C:{format_number(self.total_coins)} Pool:{mining_manager.get_pending_transaction_count()} ",
+            f"NMB:{self.network_stats.total_network_data/(1024*1024):.2f} ",
+            f"IO:{self.network_manager.get_cumulative_io()}\n"
+        )))
         
     def get_simulation_stats(self) -> Dict:
         """Get comprehensive simulation statistics"""
@@ -485,12 +496,25 @@ class BlockchainSimulator:
         
     def export_results(self, filename: str):
         """Export simulation results to file"""
-        results = self.get_simulation_stats()
-        
+        write_results(self.get_simulation_stats(), filename)
+
+
+def write_results(results, filename: str):
+    """Write simulation results to a JSON file"""
+    if ORJSON_AVAILABLE:
+        with open(filename, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2))
+    else:
         with open(filename, 'w') as f:
             json.dump(results, f, indent=2)
             
-        logger.info(f"Results exported to {filename}")
+    logger.info(f"Results exported to {filename}")
+
+
+def _option(args: Optional[argparse.Namespace], name: str, default):
+    """Value of a command line option if it was given, else default"""
+    value = getattr(args, name, None)
+    return default if value is None else value
 
 
 def run_workload_simulation(chain_name: str, workload_type: str = None, difficulty: float = None, 
@@ -513,7 +537,8 @@ def run_workload_simulation(chain_name: str, workload_type: str = None, difficul
     if chain_name not in BLOCKCHAIN_CONFIGS:
         raise ValueError(f"Unknown blockchain: {chain_name}")
         
-    chain_config = BLOCKCHAIN_CONFIGS[chain_name]
+    chain_id = ChainId[chain_name]
+    block_time = CHAIN_BLOCK_TIMES[chain_id]
     
     # Get workload configuration
     if workload_type and workload_type not in WORKLOAD_CONFIGS:
@@ -521,10 +546,16 @@ def run_workload_simulation(chain_name: str, workload_type: str = None, difficul
         
     workload_config = WORKLOAD_CONFIGS.get(workload_type, WORKLOAD_CONFIGS['NONE'])
     
-    # Use command line arguments if provided, otherwise use workload defaults
-    wallets = args.wallets if args and hasattr(args, 'wallets') else workload_config['wallets']
-    transactions = args.transactions if args and hasattr(args, 'transactions') else workload_config['transactions']
-    interval = args.interval if args and hasattr(args, 'interval') else workload_config['interval']
+    # Use command line arguments where explicitly given, otherwise workload defaults
+    wallets = _option(args, 'wallets', workload_config['wallets'])
+    transactions = _option(args, 'transactions', workload_config['transactions'])
+    interval = _option(args, 'interval', workload_config['interval'])
+    
+    # Run length: --blocks, else --years worth of this chain's blocks
+    blocks = _option(args, 'blocks', DEFAULT_CONFIG['blocks'])
+    years = _option(args, 'years', DEFAULT_CONFIG['years'])
+    if years and not blocks:
+        blocks = int(SECONDS_PER_YEAR / block_time * years)
     
     # Create simulation configuration
     config = SimulationConfig(
@@ -532,21 +563,25 @@ def run_workload_simulation(chain_name: str, workload_type: str = None, difficul
         neighbors=DEFAULT_CONFIG['neighbors'],
         miners=DEFAULT_CONFIG['miners'],
         hashrate=DEFAULT_CONFIG['hashrate'],
-        blocktime=chain_config['block_time'],
-        difficulty=difficulty or (chain_config['block_time'] * DEFAULT_CONFIG['miners'] * DEFAULT_CONFIG['hashrate']),
-        reward=chain_config['reward'],
-        halving=chain_config['halving'],
+        blocktime=block_time,
+        difficulty=difficulty or (block_time * DEFAULT_CONFIG['miners'] * DEFAULT_CONFIG['hashrate']),
+        reward=CHAIN_REWARDS[chain_id],
+        halving=CHAIN_HALVINGS[chain_id],
         wallets=wallets,
         transactions=transactions,
         interval=interval,
-        blocksize=chain_config['max_tx_per_block'],
-        blocks=DEFAULT_CONFIG['blocks'],
-        years=1.0,
-        print_interval=DEFAULT_CONFIG['print'],
+        blocksize=CHAIN_MAX_TX[chain_id],
+        blocks=blocks,
+        years=years,
+        print_interval=_option(args, 'print', DEFAULT_CONFIG['print']),
         debug=DEFAULT_CONFIG['debug']
     )
     
     # Create and run simulator
+    configure_logging()
+    logger.info("Running %s (%s) with %s workload (%s)",
+                chain_name, describe(chain_id).get('description', ''),
+                workload_type or 'NONE', describe_workload(workload_type or 'NONE').get('description', ''))
     simulator = BlockchainSimulator(config, use_traces, trace_file)
     
     try:
@@ -559,6 +594,49 @@ def run_workload_simulation(chain_name: str, workload_type: str = None, difficul
     return simulator.get_simulation_stats()
 
 
+def _init_worker():
+    """Give each worker process its own random state instead of a forked copy"""
+    random.seed()
+    mining.reseed()
+
+
+def _run_workload(run: tuple) -> tuple:
+    """
+    Pool worker: run one simulation from a run_workload_simulation argument tuple
+    
+    Returns:
+        (console output, simulation results); the output is captured so the
+        parent can write it without interleaving it with other workers'
+    """
+    output = io.StringIO()
+    with redirect_stdout(output):
+        results = run_workload_simulation(*run)
+    return output.getvalue(), results
+
+
+def run_workload_batch(runs: List[tuple], processes: Optional[int] = None) -> List[Dict]:
+    """
+    Run independent workload simulations in parallel worker processes
+    
+    Args:
+        runs: Argument tuples for run_workload_simulation, one per simulation
+        processes: Number of worker processes (None for os.cpu_count())
+        
+    Returns:
+        Simulation results, in the same order as runs
+        
+    Each simulation's console summary is written to stdout from this process,
+    in run order, as soon as it and the runs before it have finished.
+    """
+    results = []
+    with multiprocessing.Pool(processes=processes, initializer=_init_worker) as pool:
+        for output, run_results in pool.imap(_run_workload, runs):
+            sys.stdout.write(output)
+            sys.stdout.flush()
+            results.append(run_results)
+    return results
+
+
 def main():
     """Main entry point for the simulator"""
     parser = argparse.ArgumentParser(description='Blockchain Simulation')
@@ -585,13 +663,14 @@ def main():
     parser.add_argument('--halving', type=int, default=210000, help='Halving interval')
     
     # Transaction configuration
-    parser.add_argument('--wallets', type=int, default=0, help='Number of wallets')
-    parser.add_argument('--transactions', type=int, default=0, help='Transactions per wallet')
-    parser.add_argument('--interval', type=float, default=1.0, help='Transaction generation interval')
+    # (left unset by default so --workload presets apply unless overridden)
+    parser.add_argument('--wallets', type=int, help='Number of wallets (default 0)')
+    parser.add_argument('--transactions', type=int, help='Transactions per wallet (default 0)')
+    parser.add_argument('--interval', type=float, help='Transaction generation interval (default 1.0)')
     
     # Simulation parameters
     parser.add_argument('--blocks', type=int, help='Number of blocks to mine')
-    parser.add_argument('--years', type=float, default=1.0, help='Simulation duration in years')
+    parser.add_argument('--years', type=float, help='Simulation duration in years (default 1.0)')
     parser.add_argument('--print', type=int, default=144, help='Print interval')
     parser.add_argument('--debug', action='store_true', help='Enable debug mode')
     
@@ -599,16 +678,31 @@ def main():
     parser.add_argument('--use-traces', action='store_true', help='Use trace data for simulation')
     parser.add_argument('--trace-file', type=str, help='Specific trace file to load')
     
+    # Chain sweeps
+    parser.add_argument('--sweep', action='store_true',
+                       help='Run the workload on every chain instead of a single simulation')
+    parser.add_argument('--parallel', type=int, help='Worker processes for --sweep (default: CPU count)')
+    
     # Output
     parser.add_argument('--output', type=str, help='Output file for results')
     parser.add_argument('--export', type=str, help='Export file for results (alias for --output)')
     
     args = parser.parse_args()
     
+    if args.sweep:
+        configure_logging()
+        runs = [(chain, args.workload, args.difficulty, args.use_traces, args.trace_file, args)
+                for chain in BLOCKCHAIN_CONFIGS]
+        results = run_workload_batch(runs, args.parallel)
+        if args.output or args.export:
+            write_results(results, args.output or args.export)
+        return results
+        
     # Create configuration
     config = SimulationConfig.from_args(args)
     
     # Create and run simulator
+    configure_logging()
     simulator = BlockchainSimulator(config, args.use_traces, args.trace_file)
     
     try:
@@ -7,6 +7,8 @@ import time
 import subprocess
 import sys
 
+from test_performance import stream_block_lines
+
 def test_fixed_output():
     """Test the fixed output format"""
     
@@ -36,25 +38,23 @@ def test_fixed_output():
     
     try:
         # Run the simulation
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)
+        returncode, block_count, block_lines, _, errors = stream_block_lines(
+            cmd, timeout=300, keep=5)
         
         end_time = time.time()
         duration = end_time - start_time
         
         print(f"Simulation completed in {duration:.2f} seconds")
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Simulation completed successfully!")
             
             # Analyze output format
-            lines = result.stdout.split('\n')
-            block_lines = [line for line in lines if 'Sum B:' in line]
-            
-            print(f"\nFound {len(block_lines)} block output lines")
+            print(f"\nFound {block_count} block output lines")
             
             if block_lines:
                 print("\nSample output lines:")
-                for i, line in enumerate(block_lines[:5]):  # Show first 5 blocks
+                for line in block_lines:  # Show first 5 blocks
                     print(f"  {line}")
                     
                 # Check format consistency
@@ -91,9 +91,9 @@ def test_fixed_output():
                     
         else:
             print("❌ Simulation failed!")
-            print(f"Return code: {result.returncode}")
+            print(f"Return code: {returncode}")
             print("Error output:")
-            print(result.stderr)
+            print(errors)
             
     except subprocess.TimeoutExpired:
         print("❌ Simulation timed out after 5 minutes!")
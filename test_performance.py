@@ -7,6 +7,51 @@ Tests the optimized simulation with a small workload
 import time
 import subprocess
 import sys
+import tempfile
+import threading
+
+def stream_block_lines(cmd, timeout, keep):
+    """
+    Run a simulation command, scanning its output for block lines as it streams
+    
+    Only the first `keep` block lines are held in memory; stderr is spooled to
+    a temporary file so a chatty child can never block on a full pipe.
+    
+    Returns:
+        (return code, block line count, sample block lines, output length, stderr text)
+    
+    Raises:
+        subprocess.TimeoutExpired: If the command runs longer than timeout seconds
+    """
+    block_count = 0
+    output_length = 0
+    samples = []
+    timed_out = threading.Event()
+    
+    with tempfile.TemporaryFile(mode='w+') as stderr:
+        with subprocess.Popen(cmd, stdout=subprocess.PIPE, stderr=stderr,
+                              text=True, bufsize=1 << 20) as proc:
+            def expire():
+                timed_out.set()
+                proc.kill()
+                
+            timer = threading.Timer(timeout, expire)
+            timer.start()
+            try:
+                for line in proc.stdout:
+                    output_length += len(line)
+                    if 'Sum B:' in line:
+                        block_count += 1
+                        if block_count <= keep:
+                            samples.append(line.rstrip('\n'))
+                returncode = proc.wait()
+            finally:
+                timer.cancel()
+                
+        if timed_out.is_set():
+            raise subprocess.TimeoutExpired(cmd, timeout)
+        stderr.seek(0)
+        return returncode, block_count, samples, output_length, stderr.read()
 
 def test_simulation_performance():
     """Test the performance of the optimized simulation"""
@@ -37,34 +82,33 @@ def test_simulation_performance():
     
     try:
         # Run the simulation
-        result = subprocess.run(cmd, capture_output=True, text=True, timeout=300)  # 5 minute timeout
+        returncode, block_count, block_lines, output_length, errors = stream_block_lines(
+            cmd, timeout=300, keep=3)  # 5 minute timeout
         
         end_time = time.time()
         duration = end_time - start_time
         
         print(f"Simulation completed in {duration:.2f} seconds")
         
-        if result.returncode == 0:
+        if returncode == 0:
             print("✅ Simulation completed successfully!")
-            print(f"Output length: {len(result.stdout)} characters")
+            print(f"Output length: {output_length} characters")
             
             # Count blocks mined
-            lines = result.stdout.split('\n')
-            block_lines = [line for line in lines if 'Sum B:' in line]
-            print(f"Blocks mined: {len(block_lines)}")
+            print(f"Blocks mined: {block_count}")
             
             if block_lines:
                 print("Sample output:")
-                for i, line in enumerate(block_lines[:3]):  # Show first 3 blocks
+                for line in block_lines:  # Show first 3 blocks
                     print(f"  {line}")
-                if len(block_lines) > 3:
-                    print(f"  ... and {len(block_lines) - 3} more blocks")
+                if block_count > 3:
+                    print(f"  ... and {block_count - 3} more blocks")
                     
         else:
             print("❌ Simulation failed!")
-            print(f"Return code: {result.returncode}")
+            print(f"Return code: {returncode}")
             print("Error output:")
-            print(result.stderr)
+            print(errors)
             
     except subprocess.TimeoutExpired:
         print("❌ Simulation timed out after 5 minutes!")
@@ -0,0 +1,40 @@
+#!/usr/bin/env python3
+"""
+Test script to verify trace files are streamed in timestamp order
+"""
+
+import tempfile
+from pathlib import Path
+
+from trace_loader import TraceLoader
+
+def test_unsorted_csv_streams_in_order():
+    """Test that an unsorted CSV trace merges in timestamp order"""
+
+    with tempfile.TemporaryDirectory() as trace_dir:
+        # Rows deliberately out of order, as CSV exports often are
+        Path(trace_dir, "unsorted.csv").write_text(
+            "timestamp,tx_hash,sender,recipient,amount,fee\n"
+            "1.0,tx_a,alice,bob,1.0,0.1\n"
+            "5.0,tx_b,bob,carol,2.0,0.1\n"
+            "3.0,tx_c,carol,alice,3.0,0.1\n"
+            "2.0,tx_d,alice,carol,4.0,0.1\n"
+        )
+        # A second, sorted file interleaves with the first
+        Path(trace_dir, "sorted.csv").write_text(
+            "timestamp,tx_hash,sender,recipient,amount,fee\n"
+            "0.5,tx_e,bob,alice,1.0,0.1\n"
+            "4.0,tx_f,carol,bob,1.0,0.1\n"
+        )
+
+        loader = TraceLoader(trace_dir, cache=False)
+        streamed = [event.timestamp for event in loader.iter_all_traces()]
+        loaded = [event.timestamp for event in loader.load_all_traces()]
+
+        print(f"Streamed timestamps: {streamed}")
+        assert streamed == [0.5, 1.0, 2.0, 3.0, 4.0, 5.0], streamed
+        assert streamed == loaded, loaded
+        print("✅ Unsorted trace files stream in timestamp order")
+
+if __name__ == "__main__":
+    test_unsorted_csv_streams_in_order()
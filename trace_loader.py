@@ -3,12 +3,27 @@ Trace loader module for blockchain simulation
 Handles loading real-world blockchain data traces for realistic simulation
 """
 
+from __future__ import annotations
+
+import os
+import sys
 import json
 import csv
+import mmap
 import time
+import bisect
+import heapq
 import random
 import logging
-from typing import List, Dict, Optional, Generator
+import multiprocessing
+from array import array
+from collections import Counter
+from itertools import accumulate, chain, islice
+from operator import attrgetter, le
+from typing import List, Dict, Iterable, Optional, Generator
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
+from functools import partial
 from dataclasses import dataclass
 from pathlib import Path
 from datetime import datetime, timedelta
@@ -16,18 +31,130 @@ from datetime import datetime, timedelta
 # Optional import for API functionality
 try:
     import requests
+    from requests.adapters import HTTPAdapter
+    from urllib3.util.retry import Retry
     REQUESTS_AVAILABLE = True
 except ImportError:
     REQUESTS_AVAILABLE = False
     logging.warning("requests module not available. API functionality will be disabled.")
 
+# Optional fast JSON library, decodes straight from the mapping without a copy
+try:
+    import orjson
+    ORJSON_AVAILABLE = True
+except ImportError:
+    ORJSON_AVAILABLE = False
+
+# Optional streaming JSON parser, lets large traces be decoded straight from the mapping
+try:
+    import ijson
+    IJSON_AVAILABLE = True
+except ImportError:
+    IJSON_AVAILABLE = False
+
 from models import Transaction, Block
 from config import TRANSACTION_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Trace directories smaller than this are loaded in-process; forking workers costs more
+PARALLEL_LOAD_MIN_BYTES = 8 * 1024 * 1024
 
-@dataclass
+# Transactions per Bitcoin API page, and the most pages requested at once
+API_PAGE_SIZE = 50
+API_MAX_WORKERS = 16
+
+# Waits shorter than this (seconds) are skipped when streaming, releasing events in bursts
+STREAM_MIN_SLEEP = 1e-4
+
+# Version of the JSON trace cache layout; caches written under another version are reparsed
+TRACE_CACHE_FORMAT = 3
+
+
+# Low-cardinality data fields whose values repeat across events; one shared copy is kept
+_INTERNED_FIELDS = ('sender', 'recipient', 'priority', 'miner_id', 'action', 'event')
+
+
+def _intern_fields(data: Dict, fields=_INTERNED_FIELDS) -> Dict:
+    """Replace repeated string values in an event's data with interned copies"""
+    intern = sys.intern
+    for key in fields:
+        value = data.get(key)
+        if value.__class__ is str:
+            data[key] = intern(value)
+    return data
+
+
+_session = None
+
+
+def _get_session():
+    """Shared HTTP session, so API calls reuse pooled keep-alive connections"""
+    global _session
+    if _session is None:
+        _session = requests.Session()
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=16,
+                              max_retries=Retry(total=3, backoff_factor=0.2))
+        _session.mount('https://', adapter)
+        _session.mount('http://', adapter)
+    return _session
+
+
+def _fetch_api_page(url: str, offset: int) -> Optional[List[Dict]]:
+    """Fetch one page of address transactions, or None if the request failed"""
+    response = _get_session().get(url, params={'limit': API_PAGE_SIZE, 'offset': offset}, timeout=10)
+    if response.status_code != 200:
+        logger.warning(f"Failed to fetch Bitcoin data: {response.status_code}")
+        return None
+    return response.json().get('txs', [])
+
+
+def _source_signature(path: Path):
+    """Return (mtime, size) identifying the current contents of a file"""
+    st = os.stat(path)
+    return st.st_mtime_ns, st.st_size
+
+
+def _prefetch(paths):
+    """Ask the kernel to start reading files ahead, so disk reads overlap parsing"""
+    if not hasattr(os, 'posix_fadvise'):
+        return
+    for path in paths:
+        try:
+            fd = os.open(path, os.O_RDONLY)
+        except OSError:
+            continue
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        except OSError:
+            pass
+        finally:
+            os.close(fd)
+
+
+@contextmanager
+def _map_file(path):
+    """Memory-map a file read-only, yielding an empty buffer for empty files"""
+    with open(path, 'rb') as f:
+        try:
+            buf = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        except ValueError:
+            # Zero-length files cannot be mapped
+            yield b''
+            return
+        try:
+            if hasattr(buf, 'madvise') and hasattr(mmap, 'MADV_SEQUENTIAL'):
+                buf.madvise(mmap.MADV_SEQUENTIAL)
+            yield buf
+        finally:
+            buf.close()
+
+
+# Slotted dataclasses (3.10+) drop the per-event __dict__
+_SLOTS = {'slots': True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(**_SLOTS)
 class TraceEvent:
     """Represents a single event from a blockchain trace"""
     event_type: str  # transaction, block, miner_join, miner_leave, network_event
@@ -36,6 +163,65 @@ class TraceEvent:
     source: str  # Source of the trace data
 
 
+def _direct_transaction(event: TraceEvent, data: Dict) -> Transaction:
+    """Build a Transaction from a trace in the simulator's own format"""
+    return Transaction(
+        tx_id=data.get('tx_hash', f"tx_{event.timestamp}"),
+        sender=data['sender'],
+        recipient=data['recipient'],
+        amount=float(data.get('amount', 0.0)),
+        fee=float(data.get('fee', 0.0)),
+        timestamp=event.timestamp,
+        priority=data.get('priority', 'normal'),
+        network_congestion=data.get('network_congestion', 0.0)
+    )
+
+
+def _api_transaction(event: TraceEvent, data: Dict) -> Transaction:
+    """Build a Transaction from a Bitcoin API trace"""
+    return Transaction(
+        tx_id=data['tx_hash'],
+        sender="unknown",
+        recipient="unknown",
+        amount=float(data.get('amount', 0.0)),
+        fee=float(data.get('fee', 0.0)),
+        timestamp=event.timestamp,
+        priority='normal',
+        network_congestion=0.0
+    )
+
+
+def _transaction_from_event(event: TraceEvent) -> Optional[Transaction]:
+    """Convert a transaction event in either supported format"""
+    data = event.data
+    if 'sender' in data and 'recipient' in data:
+        return _direct_transaction(event, data)
+    if 'tx_hash' in data:
+        return _api_transaction(event, data)
+    return None
+
+
+def _block_from_event(event: TraceEvent) -> Block:
+    """Convert a block event"""
+    data = event.data
+    return Block(
+        block_id=data.get('block_hash', f"block_{event.timestamp}"),
+        timestamp=event.timestamp,
+        time_since_last=float(data.get('time_since_last', 0.0)),
+        transaction_count=int(data.get('transaction_count', 0)),
+        size=int(data.get('size', 0)),
+        miner_reward=float(data.get('miner_reward', 0.0)),
+        miner_id=data.get('miner_id', 'unknown')
+    )
+
+
+# Model converters keyed by event type
+_CONVERTERS = {
+    'transaction': _transaction_from_event,
+    'block': _block_from_event,
+}
+
+
 @dataclass
 class TraceLoader:
     """
@@ -48,43 +234,198 @@ class TraceLoader:
     - Historical blockchain data
     """
     
-    def __init__(self, trace_dir: str = "traces"):
+    def __init__(self, trace_dir: str = "traces", cache: bool = True):
         self.trace_dir = Path(trace_dir)
         self.trace_dir.mkdir(exist_ok=True)
+        
+        # Parsed JSON traces are cached here as JSON and reused while the source file is unchanged
+        self.cache_dir = self.trace_dir / ".cache" if cache else None
         self.loaded_traces: List[TraceEvent] = []
         self.current_index = 0
         
+        # Columnar index over loaded_traces, rebuilt when the list is replaced or resized
+        self._indexed_traces: Optional[List[TraceEvent]] = None
+        self._indexed_length = 0
+        self._timestamps = array('d')
+        self._timestamps_sorted = True
+        self._type_rows: Dict[str, array] = {}
+        
         logger.info(f"Initialized trace loader with directory: {self.trace_dir}")
         
-    def load_json_trace(self, filename: str) -> List[TraceEvent]:
-        """Load trace data from JSON file"""
+    def _parse_json_trace(self, filepath: Path, filename: str) -> Generator[TraceEvent, None, None]:
+        """
+        Parse trace events from a JSON file known to exist
+        
+        Raises on malformed input, possibly after some events were yielded;
+        callers that need all-or-nothing results must discard those.
+        """
+        count = 0
+        with _map_file(filepath) as buf:
+            if ORJSON_AVAILABLE:
+                with memoryview(buf) as view:
+                    data = orjson.loads(view)
+            elif IJSON_AVAILABLE:
+                data = ijson.items(buf, 'item', use_float=True)
+            else:
+                data = json.loads(buf[:])
+                
+            # Items are consumed while the mapping is still open
+            intern = sys.intern
+            for item in data:
+                yield TraceEvent(
+                    event_type=intern(item.get('type', 'unknown')),
+                    timestamp=item.get('timestamp', time.time()),
+                    data=_intern_fields(item.get('data', {})),
+                    source=filename
+                )
+                count += 1
+                
+        logger.info("Loaded %d events from %s", count, filename)
+        
+    def _iter_json_path(self, filepath: Path, filename: str) -> Generator[TraceEvent, None, None]:
+        """Lazily yield events from a JSON trace path, using the cache when valid"""
+        try:
+            key = _source_signature(filepath)
+        except OSError:
+            logger.warning(f"Trace file not found: {filepath}")
+            return iter(())
+            
+        cached = self._read_cache(filename, key)
+        if cached is None:
+            return self._parse_json_trace(filepath, filename)
+        return (TraceEvent(event_type, timestamp, data, filename)
+                for event_type, timestamp, data in cached)
+        
+    def iter_json_trace(self, filename: str) -> Generator[TraceEvent, None, None]:
+        """
+        Lazily yield trace events from a JSON file, using the cache when valid
+        
+        A malformed file raises from the iterator, after any events parsed
+        before the error; load_json_trace returns [] for such files instead.
+        """
+        return self._iter_json_path(self.trace_dir / filename, filename)
+        
+    def iter_csv_trace(self, filename: str) -> Generator[TraceEvent, None, None]:
+        """
+        Lazily yield trace events from a CSV file
+        
+        A malformed file raises from the iterator, after any events parsed
+        before the error; load_csv_trace returns [] for such files instead.
+        """
         filepath = self.trace_dir / filename
         
         if not filepath.exists():
             logger.warning(f"Trace file not found: {filepath}")
-            return []
+            return iter(())
+        return self._parse_csv_trace(filepath, filename)
+        
+    def _parse_csv_trace(self, filepath: Path, filename: str) -> Generator[TraceEvent, None, None]:
+        """
+        Parse trace events from a CSV file known to exist
+        
+        Raises on malformed input, possibly after some events were yielded;
+        callers that need all-or-nothing results must discard those.
+        """
+        count = 0
+        with open(filepath, 'r') as f:
+            # Rows are zipped onto the header in C rather than through DictReader
+            rows = filter(None, csv.reader(f))  # blank lines are skipped, as DictReader does
+            fields = next(rows, ())
             
-        try:
-            with open(filepath, 'r') as f:
-                data = json.load(f)
+            # The header fixes each row's keys, so the event type is decided once per file
+            if 'block_hash' in fields:
+                event_type = 'block'
+            elif 'miner_id' in fields and 'action' in fields:
+                event_type = None  # miner_<action>, taken from each row
+            else:
+                event_type = 'transaction'
                 
-            events = []
-            for item in data:
-                event = TraceEvent(
-                    event_type=item.get('type', 'unknown'),
-                    timestamp=item.get('timestamp', time.time()),
-                    data=item.get('data', {}),
+            interned = tuple(key for key in _INTERNED_FIELDS if key in fields)
+            intern = sys.intern
+            for row in map(dict, map(partial(zip, fields), rows)):
+                yield TraceEvent(
+                    event_type=event_type or intern(f"miner_{row.get('action')}"),
+                    timestamp=float(row.get('timestamp', time.time())),
+                    data=_intern_fields(row, interned),
                     source=filename
                 )
-                events.append(event)
+                count += 1
                 
-            logger.info(f"Loaded {len(events)} events from {filename}")
-            return events
+        logger.info("Loaded %d events from %s", count, filename)
+        
+    def _load_csv_path(self, filepath: Path, filename: str) -> List[TraceEvent]:
+        """Load all events from a CSV trace path, or none if it fails to parse"""
+        try:
+            return list(self._parse_csv_trace(filepath, filename))
+        except Exception as e:
+            logger.error(f"Error loading CSV trace {filename}: {e}")
+            return []
+        
+    def _read_cache(self, filename: str, key) -> Optional[List[tuple]]:
+        """Return cached (event_type, timestamp, data) rows if they match the source signature"""
+        if self.cache_dir is None:
+            return None
+        # Any unreadable, stale or foreign cache falls back to parsing the source.
+        # The cache lives in the trace directory, so it is plain JSON and can never run code
+        try:
+            with open(self.cache_dir / f"{filename}.json", 'rb') as f:
+                raw = f.read()
+            cache = orjson.loads(raw) if ORJSON_AVAILABLE else json.loads(raw)
+        except (OSError, ValueError):
+            return None
+        if (not isinstance(cache, dict) or cache.get('format') != TRACE_CACHE_FORMAT
+                or cache.get('key') != list(key)):
+            return None
+        rows = cache.get('rows')
+        if not isinstance(rows, list) or not all(isinstance(row, list) and len(row) == 3 for row in rows):
+            return None
+        return rows
+        
+    def _write_cache(self, filename: str, key, events: List[TraceEvent]):
+        """Persist parsed events for a trace file"""
+        rows = [(event.event_type, event.timestamp, event.data) for event in events]
+        try:
+            self.cache_dir.mkdir(exist_ok=True)
+            cache = {'format': TRACE_CACHE_FORMAT, 'key': list(key), 'rows': rows}
+            if ORJSON_AVAILABLE:
+                with open(self.cache_dir / f"{filename}.json", 'wb') as f:
+                    f.write(orjson.dumps(cache))
+            else:
+                with open(self.cache_dir / f"{filename}.json", 'w') as f:
+                    json.dump(cache, f, separators=(',', ':'))
+        except (OSError, TypeError, ValueError) as e:
+            logger.debug("Could not cache trace %s: %s", filename, e)
+            
+    def _load_json_path(self, filepath: Path, filename: str) -> List[TraceEvent]:
+        """Load all events from a JSON trace path, using and refreshing the cache"""
+        # Signature is taken before parsing so a concurrent rewrite is never cached as current
+        try:
+            key = _source_signature(filepath)
+        except OSError:
+            logger.warning(f"Trace file not found: {filepath}")
+            return []
             
+        cached = self._read_cache(filename, key)
+        if cached is not None:
+            logger.info("Loaded %d cached events from %s", len(cached), filename)
+            return [TraceEvent(event_type, timestamp, data, filename)
+                    for event_type, timestamp, data in cached]
+            
+        # A file that fails part way loads as nothing, never as the events before the error
+        try:
+            events = list(self._parse_json_trace(filepath, filename))
         except Exception as e:
             logger.error(f"Error loading JSON trace {filename}: {e}")
             return []
             
+        if events and self.cache_dir is not None:
+            self._write_cache(filename, key, events)
+        return events
+        
+    def load_json_trace(self, filename: str) -> List[TraceEvent]:
+        """Load trace data from JSON file"""
+        return self._load_json_path(self.trace_dir / filename, filename)
+        
     def load_csv_trace(self, filename: str) -> List[TraceEvent]:
         """Load trace data from CSV file"""
         filepath = self.trace_dir / filename
@@ -92,36 +433,7 @@ class TraceLoader:
         if not filepath.exists():
             logger.warning(f"Trace file not found: {filepath}")
             return []
-            
-        try:
-            events = []
-            with open(filepath, 'r') as f:
-                reader = csv.DictReader(f)
-                for row in reader:
-                    # Parse timestamp
-                    timestamp = float(row.get('timestamp', time.time()))
-                    
-                    # Determine event type from data
-                    event_type = 'transaction'
-                    if 'block_hash' in row:
-                        event_type = 'block'
-                    elif 'miner_id' in row and 'action' in row:
-                        event_type = f"miner_{row['action']}"
-                        
-                    event = TraceEvent(
-                        event_type=event_type,
-                        timestamp=timestamp,
-                        data=row,
-                        source=filename
-                    )
-                    events.append(event)
-                    
-            logger.info(f"Loaded {len(events)} events from {filename}")
-            return events
-            
-        except Exception as e:
-            logger.error(f"Error loading CSV trace {filename}: {e}")
-            return []
+        return self._load_csv_path(filepath, filename)
             
     def load_bitcoin_api_data(self, start_date: str, end_date: str, 
                             limit: int = 1000) -> List[TraceEvent]:
@@ -142,16 +454,19 @@ class TraceLoader:
             # Note: In production, you might want to use a more reliable API
             url = f"https://blockchain.info/rawaddr/1A1zP1eP5QGefi2DMPTfTL5SLmv7DivfNa"
             
-            response = requests.get(url, timeout=10)
-            if response.status_code != 200:
-                logger.warning(f"Failed to fetch Bitcoin data: {response.status_code}")
+            # Pages are independent, so they are requested concurrently and kept in order
+            offsets = range(0, limit, API_PAGE_SIZE)
+            with ThreadPoolExecutor(max_workers=min(API_MAX_WORKERS, len(offsets) or 1)) as executor:
+                pages = list(executor.map(lambda offset: _fetch_api_page(url, offset), offsets))
+                
+            if not any(page is not None for page in pages):
                 return []
                 
-            data = response.json()
+            txs = [tx for page in pages if page for tx in page]
             events = []
             
             # Process transactions
-            for tx in data.get('txs', [])[:limit]:
+            for tx in txs[:limit]:
                 # Parse timestamp
                 timestamp = tx.get('time', time.time())
                 
@@ -187,144 +502,221 @@ class TraceLoader:
             duration_hours: Duration of the trace in hours
             transaction_rate: Transactions per second
         """
-        events = []
         start_time = time.time()
         end_time = start_time + (duration_hours * 3600)
+        rand = random.random
+        expovariate = random.expovariate
         
+        # Draw arrival times in batches of the expected event count
+        batch = int((end_time - start_time) * transaction_rate) + 1
+        timestamps = []
         current_time = start_time
-        while current_time < end_time:
-            # Generate transaction
-            event = TraceEvent(
+        while True:
+            gaps = (expovariate(transaction_rate) for _ in range(batch))
+            arrivals = list(accumulate(chain((current_time,), gaps)))
+            cut = bisect.bisect_left(arrivals, end_time)
+            if cut < len(arrivals):
+                timestamps.extend(arrivals[:cut])
+                break
+            timestamps.extend(arrivals[:-1])
+            current_time = arrivals[-1]
+            
+        # Draw each transaction field for the whole trace at once
+        count = len(timestamps)
+        wallets = [f"wallet_{i}" for i in range(101)]
+        senders = random.choices(wallets, k=count)
+        recipients = random.choices(wallets, k=count)
+        amounts = [0.001 + 0.999 * rand() for _ in range(count)]
+        fees = [0.0001 + 0.0099 * rand() for _ in range(count)]
+        priorities = random.choices(['low', 'normal', 'high'], cum_weights=[0.2, 0.9, 1.0], k=count)
+        
+        events = [
+            TraceEvent(
                 event_type='transaction',
-                timestamp=current_time,
+                timestamp=timestamp,
                 data={
-                    'sender': f"wallet_{random.randint(0, 100)}",
-                    'recipient': f"wallet_{random.randint(0, 100)}",
-                    'amount': random.uniform(0.001, 1.0),
-                    'fee': random.uniform(0.0001, 0.01),
-                    'priority': random.choices(['low', 'normal', 'high'], weights=[0.2, 0.7, 0.1])[0]
+                    'sender': sender,
+                    'recipient': recipient,
+                    'amount': amount,
+                    'fee': fee,
+                    'priority': priority
                 },
                 source='synthetic'
             )
-            events.append(event)
-            
-            # Generate miner events occasionally
-            if random.random() < 0.01:  # 1% chance
-                miner_event = TraceEvent(
-                    event_type='miner_join' if random.random() < 0.5 else 'miner_leave',
-                    timestamp=current_time,
-                    data={
-                        'miner_id': f"miner_{random.randint(0, 20)}",
-                        'hashrate': random.uniform(100, 1000)
-                    },
-                    source='synthetic'
-                )
-                events.append(miner_event)
-                
-            # Generate network events occasionally
-            if random.random() < 0.005:  # 0.5% chance
-                network_event = TraceEvent(
-                    event_type='network_event',
-                    timestamp=current_time,
-                    data={
-                        'event': random.choice(['partition', 'heal', 'congestion']),
-                        'severity': random.uniform(0.1, 1.0)
-                    },
-                    source='synthetic'
-                )
-                events.append(network_event)
-                
-            # Move to next event time
-            current_time += random.exponential(1.0 / transaction_rate)
-            
-        # Sort events by timestamp
-        events.sort(key=lambda x: x.timestamp)
+            for timestamp, sender, recipient, amount, fee, priority
+            in zip(timestamps, senders, recipients, amounts, fees, priorities)
+        ]
+        
+        # Miner events occur alongside 1% of transactions
+        miners = [f"miner_{i}" for i in range(21)]
+        events.extend(
+            TraceEvent(
+                event_type='miner_join' if rand() < 0.5 else 'miner_leave',
+                timestamp=timestamp,
+                data={
+                    'miner_id': random.choice(miners),
+                    'hashrate': 100 + 900 * rand()
+                },
+                source='synthetic'
+            )
+            for timestamp in timestamps if rand() < 0.01
+        )
+        
+        # Network events occur alongside 0.5% of transactions
+        events.extend(
+            TraceEvent(
+                event_type='network_event',
+                timestamp=timestamp,
+                data={
+                    'event': random.choice(['partition', 'heal', 'congestion']),
+                    'severity': 0.1 + 0.9 * rand()
+                },
+                source='synthetic'
+            )
+            for timestamp in timestamps if rand() < 0.005
+        )
+        
+        # Sorted runs merge in linear time; ties keep transactions first
+        events.sort(key=attrgetter('timestamp'))
         
         logger.info(f"Generated {len(events)} synthetic trace events")
         return events
         
-    def load_all_traces(self) -> List[TraceEvent]:
-        """Load all available trace files"""
+    def _trace_files(self) -> List[Path]:
+        """List trace files in the order they are loaded"""
+        return sorted(self.trace_dir.glob("*.json")) + sorted(self.trace_dir.glob("*.csv"))
+        
+    def _iter_trace_file(self, path: Path) -> Generator[TraceEvent, None, None]:
+        """Lazily yield events from a trace file of either format"""
+        if path.suffix == '.csv':
+            return self._parse_csv_trace(path, path.name)
+        return self._iter_json_path(path, path.name)
+        
+    def _load_trace_file(self, path: Path) -> List[TraceEvent]:
+        """Load all events from a trace file of either format"""
+        if path.suffix == '.csv':
+            return self._load_csv_path(path, path.name)
+        return self._load_json_path(path, path.name)
+        
+    def _iter_sorted_trace_file(self, path: Path) -> Generator[TraceEvent, None, None]:
+        """Yield a trace file's events sorted by timestamp"""
+        # CSV and API-dumped traces are not guaranteed to be in order
+        events = list(self._iter_trace_file(path))
+        events.sort(key=attrgetter('timestamp'))
+        yield from events
+        
+    def iter_all_traces(self) -> Generator[TraceEvent, None, None]:
+        """
+        Yield events from all trace files in timestamp order
+        
+        Each file is read and sorted on its own, then the sorted files are
+        merged. A malformed file raises from the iterator rather than ending
+        its stream early; load_all_traces skips such files instead.
+        """
+        streams = [self._iter_sorted_trace_file(path) for path in self._trace_files()]
+        return heapq.merge(*streams, key=attrgetter('timestamp'))
+        
+    def load_all_traces(self, processes: Optional[int] = None) -> List[TraceEvent]:
+        """
+        Load all available trace files
+        
+        Args:
+            processes: Worker processes to parse files with (None to decide from
+                the file count and total size, 1 to load in-process)
+        """
+        paths = self._trace_files()
+        if processes is None:
+            total_bytes = sum(path.stat().st_size for path in paths)
+            processes = 1 if total_bytes < PARALLEL_LOAD_MIN_BYTES else multiprocessing.cpu_count()
+        processes = min(processes, len(paths))
+        
         all_events = []
+        if processes > 1:
+            # Files parse independently; rows come back in file order
+            jobs = [(str(self.trace_dir), path.name, self.cache_dir is not None) for path in paths]
+            with multiprocessing.Pool(processes=processes) as pool:
+                for filename, rows in pool.imap(_load_trace_rows, jobs):
+                    all_events.extend(TraceEvent(event_type, timestamp, data, filename)
+                                      for event_type, timestamp, data in rows)
+        else:
+            _prefetch(paths)
+            for path in paths:
+                all_events.extend(self._load_trace_file(path))
+                
+        # Files are usually sorted runs, which the sort merges in near-linear time
+        all_events.sort(key=attrgetter('timestamp'))
+        
+        logger.info(f"Loaded {len(all_events)} total trace events")
+        return all_events
         
-        # Load JSON traces
-        for json_file in self.trace_dir.glob("*.json"):
-            events = self.load_json_trace(json_file.name)
-            all_events.extend(events)
+    def _index(self):
+        """
+        Build the columnar index over loaded_traces if it is stale
+        
+        Call invalidate_index() after mutating loaded_traces in place without
+        changing its length.
+        """
+        traces = self.loaded_traces
+        if traces is self._indexed_traces and len(traces) == self._indexed_length:
+            return
             
-        # Load CSV traces
-        for csv_file in self.trace_dir.glob("*.csv"):
-            events = self.load_csv_trace(csv_file.name)
-            all_events.extend(events)
+        type_rows = {}
+        for row, event_type in enumerate(map(attrgetter('event_type'), traces)):
+            rows = type_rows.get(event_type)
+            if rows is None:
+                rows = type_rows[event_type] = array('l')
+            rows.append(row)
             
-        # Sort all events by timestamp
-        all_events.sort(key=lambda x: x.timestamp)
+        timestamps = array('d', map(attrgetter('timestamp'), traces))
+        self._timestamps = timestamps
+        self._timestamps_sorted = all(map(le, timestamps, islice(timestamps, 1, None)))
+        self._type_rows = type_rows
+        self._indexed_traces = traces
+        self._indexed_length = len(traces)
         
-        logger.info(f"Loaded {len(all_events)} total trace events")
-        return all_events
+    def invalidate_index(self):
+        """Force the columnar index to be rebuilt on next use"""
+        self._indexed_traces = None
         
     def get_events_by_type(self, event_type: str) -> List[TraceEvent]:
         """Get all events of a specific type"""
-        return [event for event in self.loaded_traces if event.event_type == event_type]
+        self._index()
+        rows = self._type_rows.get(event_type)
+        if not rows:
+            return []
+        return list(map(self.loaded_traces.__getitem__, rows))
         
     def get_events_in_timerange(self, start_time: float, end_time: float) -> List[TraceEvent]:
         """Get events within a specific time range"""
+        self._index()
+        traces = self.loaded_traces
+        timestamps = self._timestamps
+        if self._timestamps_sorted:
+            lo = bisect.bisect_left(timestamps, start_time)
+            hi = bisect.bisect_right(timestamps, end_time, lo)
+            return traces[lo:hi]
+            
         return [
-            event for event in self.loaded_traces
-            if start_time <= event.timestamp <= end_time
+            traces[row] for row, timestamp in enumerate(timestamps)
+            if start_time <= timestamp <= end_time
         ]
         
     def convert_to_transaction(self, event: TraceEvent) -> Optional[Transaction]:
         """Convert a trace event to a Transaction object"""
         if event.event_type != 'transaction':
             return None
-            
-        data = event.data
-        
-        # Handle different data formats
-        if 'sender' in data and 'recipient' in data:
-            # Direct transaction format
-            return Transaction(
-                tx_id=data.get('tx_hash', f"tx_{event.timestamp}"),
-                sender=data['sender'],
-                recipient=data['recipient'],
-                amount=float(data.get('amount', 0.0)),
-                fee=float(data.get('fee', 0.0)),
-                timestamp=event.timestamp,
-                priority=data.get('priority', 'normal'),
-                network_congestion=data.get('network_congestion', 0.0)
-            )
-        elif 'tx_hash' in data:
-            # Bitcoin API format
-            return Transaction(
-                tx_id=data['tx_hash'],
-                sender="unknown",
-                recipient="unknown",
-                amount=float(data.get('amount', 0.0)),
-                fee=float(data.get('fee', 0.0)),
-                timestamp=event.timestamp,
-                priority='normal',
-                network_congestion=0.0
-            )
-            
-        return None
+        return _transaction_from_event(event)
         
     def convert_to_block(self, event: TraceEvent) -> Optional[Block]:
         """Convert a trace event to a Block object"""
         if event.event_type != 'block':
             return None
-            
-        data = event.data
-        
-        return Block(
-            block_id=data.get('block_hash', f"block_{event.timestamp}"),
-            timestamp=event.timestamp,
-            time_since_last=float(data.get('time_since_last', 0.0)),
-            transaction_count=int(data.get('transaction_count', 0)),
-            size=int(data.get('size', 0)),
-            miner_reward=float(data.get('miner_reward', 0.0)),
-            miner_id=data.get('miner_id', 'unknown')
-        )
+        return _block_from_event(event)
+        
+    def convert_event(self, event: TraceEvent):
+        """Convert a trace event to a Transaction or Block, or None if it has no model"""
+        converter = _CONVERTERS.get(event.event_type)
+        return converter(event) if converter is not None else None
         
     def stream_events(self, start_time: float = None, 
                      end_time: float = None) -> Generator[TraceEvent, None, None]:
@@ -334,32 +726,50 @@ class TraceLoader:
         Args:
             start_time: Start time for streaming (None for current time)
             end_time: End time for streaming (None for no end)
+            
+        When nothing is loaded, events stream from the trace files, and a
+        malformed file raises as in iter_all_traces.
         """
         if start_time is None:
             start_time = time.time()
             
-        # Load all traces if not already loaded
-        if not self.loaded_traces:
-            self.loaded_traces = self.load_all_traces()
-            
-        # Filter events by time range
-        events = self.loaded_traces
-        if start_time:
-            events = [e for e in events if e.timestamp >= start_time]
-        if end_time:
-            events = [e for e in events if e.timestamp <= end_time]
-            
+        # Stream straight from disk if nothing has been loaded yet
+        events = self.loaded_traces or self.iter_all_traces()
+        
+        # Map trace timestamps onto the monotonic clock once, so wall-clock
+        # adjustments cannot stall or rush playback
+        monotonic = time.monotonic
+        sleep = time.sleep
+        offset = monotonic() - time.time()
+        now = float('-inf')
+        
         # Stream events
         for event in events:
-            # Wait until the event's timestamp
-            wait_time = event.timestamp - time.time()
-            if wait_time > 0:
-                time.sleep(wait_time)
+            timestamp = event.timestamp
+            if start_time and timestamp < start_time:
+                continue
+            if end_time and timestamp > end_time:
+                continue
                 
+            # Events already due at the last clock read are yielded without another read
+            deadline = timestamp + offset
+            if deadline > now:
+                now = monotonic()
+                if deadline - now > STREAM_MIN_SLEEP:
+                    sleep(deadline - now)
+                    now = deadline
+                    
             yield event
             
-    def save_trace(self, events: List[TraceEvent], filename: str):
-        """Save trace events to a file"""
+    def save_trace(self, events: List[TraceEvent], filename: str, pretty: bool = False):
+        """
+        Save trace events to a file
+        
+        Args:
+            events: Events to save
+            filename: File name within the trace directory
+            pretty: Indent the JSON for reading (about twice the size to write and load)
+        """
         filepath = self.trace_dir / filename
         
         try:
@@ -372,39 +782,66 @@ class TraceLoader:
                     'source': event.source
                 })
                 
-            with open(filepath, 'w') as f:
-                json.dump(data, f, indent=2)
+            if ORJSON_AVAILABLE:
+                with open(filepath, 'wb') as f:
+                    f.write(orjson.dumps(data, option=orjson.OPT_INDENT_2 if pretty else None))
+            else:
+                with open(filepath, 'w') as f:
+                    if pretty:
+                        json.dump(data, f, indent=2)
+                    else:
+                        json.dump(data, f, separators=(',', ':'))
                 
             logger.info(f"Saved {len(events)} events to {filename}")
             
         except Exception as e:
             logger.error(f"Error saving trace {filename}: {e}")
             
-    def get_trace_statistics(self) -> Dict:
-        """Get statistics about loaded traces"""
-        if not self.loaded_traces:
-            return {'total_events': 0}
-            
-        event_types = {}
-        sources = {}
-        time_range = {
-            'start': min(e.timestamp for e in self.loaded_traces),
-            'end': max(e.timestamp for e in self.loaded_traces)
-        }
+    def get_trace_statistics(self, events: Optional[Iterable[TraceEvent]] = None) -> Dict:
+        """
+        Get statistics about loaded traces
         
-        for event in self.loaded_traces:
-            # Count event types
-            event_types[event.event_type] = event_types.get(event.event_type, 0) + 1
-            
-            # Count sources
-            sources[event.source] = sources.get(event.source, 0) + 1
+        Args:
+            events: Events to summarize in a single pass (defaults to the loaded traces)
+        """
+        if events is None:
+            # Answered from the columnar index without touching each event
+            self._index()
+            timestamps = self._timestamps
+            if not timestamps:
+                return {'total_events': 0}
+            total = len(timestamps)
+            start = min(timestamps)
+            end = max(timestamps)
+            event_types = {event_type: len(rows) for event_type, rows in self._type_rows.items()}
+            sources = Counter(map(attrgetter('source'), self.loaded_traces))
+        else:
+            total = 0
+            start = float('inf')
+            end = float('-inf')
+            event_types = Counter()
+            sources = Counter()
             
+            for event in events:
+                total += 1
+                timestamp = event.timestamp
+                if timestamp < start:
+                    start = timestamp
+                if timestamp > end:
+                    end = timestamp
+                event_types[event.event_type] += 1
+                sources[event.source] += 1
+                
+            if not total:
+                return {'total_events': 0}
+                
+        time_range = {'start': start, 'end': end}
         return {
-            'total_events': len(self.loaded_traces),
-            'event_types': event_types,
-            'sources': sources,
+            'total_events': total,
+            'event_types': dict(event_types),
+            'sources': dict(sources),
             'time_range': time_range,
-            'duration_hours': (time_range['end'] - time_range['start']) / 3600
+            'duration_hours': (end - start) / 3600
         }
         
     def to_dict(self) -> Dict:
@@ -414,4 +851,12 @@ class TraceLoader:
             'loaded_traces': len(self.loaded_traces),
             'current_index': self.current_index,
             'statistics': self.get_trace_statistics()
-        } 
\ No newline at end of file
+        }
+
+
+def _load_trace_rows(job: tuple):
+    """Pool worker: parse one trace file into (event_type, timestamp, data) rows"""
+    trace_dir, filename, cache = job
+    loader = TraceLoader(trace_dir, cache=cache)
+    events = loader._load_trace_file(loader.trace_dir / filename)
+    return filename, [(event.event_type, event.timestamp, event.data) for event in events]
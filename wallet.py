@@ -3,19 +3,34 @@ Wallet module for blockchain simulation
 Handles wallet operations, transaction generation, and balance management
 """
 
+import heapq
 import random
 import time
-import threading
 import logging
 from typing import List, Dict, Optional
 from dataclasses import dataclass
 from collections import deque
+from operator import attrgetter
 
 from models import Wallet, Transaction
 from config import TRANSACTION_CONFIG
 
 logger = logging.getLogger(__name__)
 
+# Fee multiplier per transaction priority
+PRIORITY_MULTIPLIERS = {
+    'low': 0.5,
+    'normal': 1.0,
+    'high': 2.0,
+    'urgent': 5.0
+}
+
+# Congestion levels quoted by get_fee_estimate
+ESTIMATE_CONGESTIONS = (0.0, 0.25, 0.5, 0.75, 1.0)
+_ESTIMATE_LABELS = tuple(f'{congestion*100:.0f}%_congestion' for congestion in ESTIMATE_CONGESTIONS)
+
+# Transactions handed to a batch callback at a time during generation
+TRANSACTION_BATCH_SIZE = 10000
 
 @dataclass
 class FeeCalculator:
@@ -49,31 +64,46 @@ class FeeCalculator:
         Returns:
             Calculated fee amount
         """
-        # Base fee calculation
-        base_fee = amount * self.base_fee_rate
-        
-        # Priority multiplier
-        priority_multipliers = {
-            'low': 0.5,
-            'normal': 1.0,
-            'high': 2.0,
-            'urgent': 5.0
-        }
-        priority_mult = priority_multipliers.get(priority, 1.0)
+        # Base fee, scaled by priority (unknown priorities count as normal),
+        # network congestion (up to 3x) and block utilization (up to 1.5x for full blocks)
+        fee = (amount * self.base_fee_rate
+               * PRIORITY_MULTIPLIERS.get(priority, 1.0)
+               * (1.0 + (network_congestion * 2.0))
+               * (1.0 + (self.block_utilization * 0.5)))
         
-        # Network congestion multiplier
-        congestion_mult = 1.0 + (network_congestion * 2.0)  # Up to 3x for high congestion
+        return self._clamp_fee(fee)
         
-        # Block utilization factor
-        utilization_factor = 1.0 + (self.block_utilization * 0.5)  # Up to 1.5x for full blocks
+    def _clamp_fee(self, fee: float) -> float:
+        """Apply min/max constraints to a fee"""
+        return max(self.min_fee, min(fee, self.max_fee))
         
-        # Calculate final fee
-        fee = base_fee * priority_mult * congestion_mult * utilization_factor
-        
-        # Apply min/max constraints
-        fee = max(self.min_fee, min(fee, self.max_fee))
+    def calculate_fee_batch(self, amount: float, priorities: List[str],
+                            congestions: List[float]) -> List[List[float]]:
+        """
+        Calculate fees for every priority/congestion combination at once
         
-        return fee
+        Args:
+            amount: Transaction amount
+            priorities: Transaction priorities, one result row each
+            congestions: Network congestion levels, one result column each
+            
+        Returns:
+            Fee matrix indexed as [priority][congestion], matching calculate_fee
+        """
+        # Factors shared by every cell are computed once
+        base_fee = amount * self.base_fee_rate
+        utilization_factor = 1.0 + (self.block_utilization * 0.5)
+        congestion_mults = [1.0 + (congestion * 2.0) for congestion in congestions]
+        clamp_fee = self._clamp_fee
+        
+        fees = []
+        for priority in priorities:
+            row_base = base_fee * PRIORITY_MULTIPLIERS.get(priority, 1.0)
+            fees.append([
+                clamp_fee(row_base * congestion_mult * utilization_factor)
+                for congestion_mult in congestion_mults
+            ])
+        return fees
         
     def update_network_conditions(self, congestion: float, block_utilization: float):
         """Update network conditions for fee calculation"""
@@ -82,12 +112,8 @@ class FeeCalculator:
         
     def get_fee_estimate(self, amount: float, priority: str = 'normal') -> Dict:
         """Get fee estimate for different network conditions"""
-        estimates = {}
-        for congestion in [0.0, 0.25, 0.5, 0.75, 1.0]:
-            fee = self.calculate_fee(amount, priority, congestion)
-            estimates[f'{congestion*100:.0f}%_congestion'] = fee
-            
-        return estimates
+        fees = self.calculate_fee_batch(amount, [priority], ESTIMATE_CONGESTIONS)[0]
+        return dict(zip(_ESTIMATE_LABELS, fees))
 
 
 @dataclass
@@ -107,7 +133,6 @@ class WalletManager:
         self.transaction_count = transaction_count
         self.interval = interval
         self.wallets: Dict[str, Wallet] = {}
-        self.transaction_generators: List[threading.Thread] = []
         self.running = False
         self.transaction_callback = None
         
@@ -134,8 +159,15 @@ class WalletManager:
             self.wallets[wallet_id] = wallet
             logger.debug(f"Created wallet {wallet_id} with balance {initial_balance:.6f}")
             
-    def start_transaction_generation(self, callback):
-        """Start generating transactions"""
+    def start_transaction_generation(self, callback, batch_callback=None):
+        """
+        Start generating transactions
+        
+        Args:
+            callback: Called with each transaction as it is generated
+            batch_callback: If given, called instead of callback with lists of
+                up to TRANSACTION_BATCH_SIZE transactions
+        """
         if self.running:
             logger.warning("Transaction generation already running")
             return
@@ -155,178 +187,45 @@ class WalletManager:
         total_transactions = len(self.wallets) * self.transaction_count
         logger.info(f"Generating {total_transactions} transactions...")
         
-        for i in range(total_transactions):
+        wallet_total = len(self.wallets)
+        per_wallet = self.transaction_count
+        # Sender and recipient names are formatted once per wallet, not per transaction
+        senders = [f"wallet_{w}" for w in range(wallet_total)]
+        recipients = senders[1:] + senders[:1]
+        for start in range(0, total_transactions, TRANSACTION_BATCH_SIZE):
             if not self.running:
                 break
                 
-            # Simple transaction creation
-            wallet_idx = i // self.transaction_count
-            wallet_id = f"wallet_{wallet_idx}"
-            recipient_id = f"wallet_{(wallet_idx + 1) % len(self.wallets)}"
-            
-            transaction = Transaction(
-                tx_id=f"tx_{i}",
-                sender=wallet_id,
-                recipient=recipient_id,
-                amount=1.0,  # Fixed amount for simplicity
-                fee=0.01,    # Fixed fee
-                timestamp=time.time()
-            )
-            
-            if self.transaction_callback:
-                self.transaction_callback(transaction)
-                
-            # Log progress every 1000 transactions
-            if (i + 1) % 1000 == 0:
-                logger.info(f"Generated {i + 1}/{total_transactions} transactions")
-                
-        logger.info(f"Generated {total_transactions} transactions instantly")
-        
-    def _generate_transaction_batch(self, start_idx: int, end_idx: int):
-        """Generate a batch of transactions - OPTIMIZED VERSION"""
-        wallet_ids = list(self.wallets.keys())
-        
-        for i in range(start_idx, end_idx):
-            if not self.running:
-                break
-                
-            # Calculate which wallet and transaction number
-            wallet_idx = i // self.transaction_count
-            tx_num = i % self.transaction_count
+            # Simple transaction creation, a batch at a time. The clock is read
+            # once per batch; transactions are spaced a microsecond apart from it.
+            batch_time = time.time() - start * 1e-6
+            batch = [
+                Transaction(
+                    tx_id=f"tx_{i}",
+                    sender=senders[i // per_wallet],
+                    recipient=recipients[i // per_wallet],
+                    amount=1.0,  # Fixed amount for simplicity
+                    fee=0.01,    # Fixed fee
+                    timestamp=batch_time + i * 1e-6
+                )
+                for i in range(start, min(start + TRANSACTION_BATCH_SIZE, total_transactions))
+            ]
             
-            if wallet_idx < len(wallet_ids):
-                wallet_id = wallet_ids[wallet_idx]
-                self._generate_single_transaction(wallet_id, tx_num)
-                
-    def _generate_single_transaction(self, wallet_id: str, tx_num: int):
-        """Generate a single transaction - OPTIMIZED VERSION"""
-        try:
-            transaction = self._create_transaction(wallet_id)
-            if transaction and self.transaction_callback:
-                self.transaction_callback(transaction)
-        except Exception as e:
-            logger.error(f"Error generating transaction {tx_num} for {wallet_id}: {e}")
-        
-    def _generate_all_transactions_for_wallet(self, wallet_id: str):
-        """Generate all transactions for a specific wallet upfront - OPTIMIZED VERSION"""
-        wallet = self.wallets[wallet_id]
-        
-        for i in range(self.transaction_count):
-            if not self.running:
-                break
-                
-            try:
-                # Create transaction with enhanced fee logic
-                transaction = self._create_transaction(wallet_id)
-                
-                if transaction and self.transaction_callback:
+            if batch_callback:
+                batch_callback(batch)
+            elif self.transaction_callback:
+                for transaction in batch:
                     self.transaction_callback(transaction)
                     
-            except Exception as e:
-                logger.error(f"Error generating transaction for {wallet_id}: {e}")
-                
-    def _generate_transactions_for_wallet(self, wallet_id: str):
-        """Generate transactions for a specific wallet (legacy method) - OPTIMIZED VERSION"""
-        wallet = self.wallets[wallet_id]
-        
-        for i in range(self.transaction_count):
-            if not self.running:
-                break
-                
-            try:
-                # Create transaction with enhanced fee logic
-                transaction = self._create_transaction(wallet_id)
-                
-                if transaction and self.transaction_callback:
-                    self.transaction_callback(transaction)
-                    
-            except Exception as e:
-                logger.error(f"Error generating transaction for {wallet_id}: {e}")
+            logger.info("Generated %d/%d transactions", start + len(batch), total_transactions)
+            
+        logger.info(f"Generated {total_transactions} transactions instantly")
         
     def stop_transaction_generation(self):
         """Stop generating transactions"""
         self.running = False
-        
-        # Wait for threads to finish
-        for thread in self.transaction_generators:
-            if thread.is_alive():
-                thread.join(timeout=2.0)
-                
         logger.info("Stopped transaction generation")
         
-    def _generate_transactions_for_wallet(self, wallet_id: str):
-        """Generate transactions for a specific wallet"""
-        wallet = self.wallets[wallet_id]
-        
-        for i in range(self.transaction_count):
-            if not self.running:
-                break
-                
-            try:
-                # Create transaction with enhanced fee logic
-                transaction = self._create_transaction(wallet_id)
-                
-                if transaction and self.transaction_callback:
-                    self.transaction_callback(transaction)
-                    
-                # Wait for next transaction (reduced wait time for faster generation)
-                time.sleep(max(0.01, self.interval))  # Minimum 0.01s wait
-                
-            except Exception as e:
-                logger.error(f"Error generating transaction for {wallet_id}: {e}")
-                time.sleep(0.1)  # Reduced wait before retrying
-                
-    def _create_transaction(self, sender_id: str) -> Optional[Transaction]:
-        """Create a new transaction with enhanced fee logic"""
-        try:
-            # Select random recipient
-            available_recipients = [w for w in self.wallets.keys() if w != sender_id]
-            if not available_recipients:
-                logger.warning(f"No available recipients for {sender_id}")
-                return None
-                
-            recipient_id = random.choice(available_recipients)
-            
-            # Generate random amount
-            amount = random.uniform(
-                TRANSACTION_CONFIG['min_amount'],
-                TRANSACTION_CONFIG['max_amount']
-            )
-            
-            # Simplified fee calculation for speed
-            fee = amount * 0.01  # 1% fee
-            
-            # Check if wallet has sufficient balance
-            sender_wallet = self.wallets[sender_id]
-            total_cost = amount + fee
-            
-            if sender_wallet.balance < total_cost:
-                # Skip balance check for speed - assume sufficient balance
-                pass
-                
-            # Create transaction with simplified ID
-            transaction = Transaction(
-                tx_id=f"tx_{sender_id}_{int(time.time() * 1000000)}",
-                sender=sender_id,
-                recipient=recipient_id,
-                amount=amount,
-                fee=fee,
-                timestamp=time.time()
-            )
-            
-            # Add priority and network info to transaction
-            transaction.priority = 'normal'
-            transaction.network_congestion = self.network_congestion
-            
-            # Update wallet balance (skip for speed)
-            # sender_wallet.subtract_balance(amount, fee)
-            
-            return transaction
-            
-        except Exception as e:
-            logger.error(f"Error creating transaction: {e}")
-            return None
-            
     def add_mining_reward(self, miner_id: str, amount: float):
         """Add mining reward to a wallet"""
         if miner_id in self.wallets:
@@ -340,14 +239,21 @@ class WalletManager:
             
     def process_confirmed_transaction(self, transaction: Transaction):
         """Process a confirmed transaction"""
-        # Update recipient wallet
-        if transaction.recipient in self.wallets:
-            self.wallets[transaction.recipient].add_balance(transaction.amount)
+        self.process_confirmed_transactions([transaction])
+        
+    def process_confirmed_transactions(self, transactions: List[Transaction]):
+        """Process a block's worth of confirmed transactions in one call"""
+        get_wallet = self.wallets.get
+        for transaction in transactions:
+            # Update recipient wallet
+            wallet = get_wallet(transaction.recipient)
+            if wallet is not None:
+                wallet.add_balance(transaction.amount)
+                
+            # Update transaction status
+            transaction.status = "confirmed"
             
-        # Update transaction status
-        transaction.status = "confirmed"
-        
-        logger.debug(f"Processed confirmed transaction {transaction.tx_id}")
+        logger.debug("Processed %d confirmed transactions", len(transactions))
         
     def update_network_conditions(self, congestion: float, block_utilization: float):
         """Update network conditions for fee calculation"""
@@ -401,21 +307,18 @@ class WalletManager:
                 'max_fee': TRANSACTION_CONFIG['max_fee'],
                 'base_fee_rate': TRANSACTION_CONFIG['fee_rate']
             },
-            'wallets': {}
+            'wallets': {wallet_id: wallet.to_dict() for wallet_id, wallet in self.wallets.items()}
         }
         
-        for wallet_id, wallet in self.wallets.items():
-            stats['wallets'][wallet_id] = wallet.to_dict()
-            
         return stats
         
     def get_richest_wallets(self, count: int = 10) -> List[Dict]:
         """Get the richest wallets"""
-        wallet_list = list(self.wallets.values())
-        wallet_list.sort(key=lambda w: w.balance, reverse=True)
+        # Partial selection of the top count; ties keep insertion order like a stable sort
+        top_wallets = heapq.nlargest(count, self.wallets.values(), key=attrgetter('balance'))
         
         richest = []
-        for i, wallet in enumerate(wallet_list[:count]):
+        for i, wallet in enumerate(top_wallets):
             richest.append({
                 'rank': i + 1,
                 'wallet_id': wallet.wallet_id,
@@ -511,6 +414,8 @@ class WalletManager:
             
     def to_dict(self) -> Dict:
         """Convert wallet manager to dictionary"""
+        # The per-wallet dicts are built once, in the stats, and shared with 'wallets'
+        stats = self.get_all_wallet_stats()
         return {
             'wallet_count': self.wallet_count,
             'transaction_count': self.transaction_count,
@@ -520,7 +425,7 @@ class WalletManager:
                 'congestion': self.network_congestion,
                 'block_utilization': self.block_utilization
             },
-            'wallets': {wid: wallet.to_dict() for wid, wallet in self.wallets.items()},
-            'stats': self.get_all_wallet_stats(),
+            'wallets': stats['wallets'],
+            'stats': stats,
             'fee_stats': self.get_fee_statistics()
         } 
\ No newline at end of file